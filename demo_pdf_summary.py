@@ -5,16 +5,24 @@ Demo script showing the new PDF summary functionality
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from io import StringIO
 from pathlib import Path
 
-def create_demo_documents():
-    """Create some demo documents for testing"""
-    demo_dir = Path("demo_docs")
-    demo_dir.mkdir(exist_ok=True)
-    
-    # Create various types of demo documents
-    documents = [
-        ("quarterly_report_2024-Q3.txt", """Quarterly Financial Report - Q3 2024
+from document_renamer import build_parser, main as renamer_main
+
+# Section separators used throughout the demo output
+_BAR = "=" * 60
+_THIN = "-" * 40
+
+# The summary PDF goes next to demo_docs, not into it, so the later dry run and
+# --summarize-only runs do not pick it up; reruns on the same day replace it
+_DEMO_PDF = f"{datetime.now():%Y.%m.%d}_Demo_Analysis_Summary.pdf"
+
+def _iter_demo_docs():
+    """Yield the demo documents as (filename, bytes) pairs, one at a time"""
+    yield "quarterly_report_2024-Q3.txt", b"""Quarterly Financial Report - Q3 2024
 
 Executive Summary:
 This report presents the financial performance for the third quarter of 2024.
@@ -27,9 +35,9 @@ Key Highlights:
 - International sales expanded to 3 new markets
 
 Recommendations:
-Continue investment in high-growth product lines and expand marketing efforts."""),
+Continue investment in high-growth product lines and expand marketing efforts."""
 
-        ("meeting_notes_sept_15_2024.md", """# Board Meeting Notes
+    yield "meeting_notes_sept_15_2024.md", b"""# Board Meeting Notes
 Date: September 15, 2024
 Attendees: CEO, CFO, COO, Board Members
 
@@ -48,9 +56,9 @@ Attendees: CEO, CFO, COO, Board Members
 ### Action Items:
 - [ ] Prepare detailed expansion proposal (Due: Oct 1)
 - [ ] Review infrastructure vendors (Due: Oct 15)
-- [ ] Submit budget proposals (Due: Nov 1)"""),
+- [ ] Submit budget proposals (Due: Nov 1)"""
 
-        ("contract_amendment_2024.txt", """CONTRACT AMENDMENT - Service Agreement
+    yield "contract_amendment_2024.txt", b"""CONTRACT AMENDMENT - Service Agreement
 
 Amendment Date: August 22, 2024
 Original Contract Date: January 10, 2024
@@ -63,9 +71,9 @@ This amendment modifies the following terms:
 4. Milestone deliverables updated per attached schedule
 
 Both parties agree to these modifications effective immediately.
-Signatures required by both parties within 15 business days."""),
+Signatures required by both parties within 15 business days."""
 
-        ("invoice_2024_001.txt", """INVOICE #2024-001
+    yield "invoice_2024_001.txt", b"""INVOICE #2024-001
 
 Bill To: ABC Corporation
 Invoice Date: July 15, 2024
@@ -81,9 +89,9 @@ Tax (8.5%): $807.50
 Total Amount Due: $10,307.50
 
 Payment Terms: Net 30 days
-Thank you for your business!"""),
+Thank you for your business!"""
 
-        ("research_paper_draft.txt", """Research Paper: Digital Transformation in Small Business
+    yield "research_paper_draft.txt", b"""Research Paper: Digital Transformation in Small Business
 
 Abstract:
 This study examines the impact of digital transformation initiatives on small business performance.
@@ -102,81 +110,109 @@ Methodology:
 Findings:
 Companies that invested in digital transformation showed 23% average revenue growth.
 Key success factors include leadership commitment and employee training.
-Main barriers include budget constraints and technical expertise gaps.""")
-    ]
+Main barriers include budget constraints and technical expertise gaps."""
+
+def run_renamer(*args):
+    """Run the document renamer CLI in this interpreter"""
+    try:
+        renamer_main(list(args))
+    except SystemExit:
+        pass
+
+def create_demo_documents():
+    """Create some demo documents for testing; returns (folder, documents written)"""
+    demo_dir = Path("demo_docs")
+    demo_dir.mkdir(exist_ok=True)
+    demo_dir = demo_dir.resolve()
     
-    for filename, content in documents:
-        file_path = demo_dir / filename
-        file_path.write_text(content)
+    # The files are independent, so let the writes overlap
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        written = sum(1 for _ in executor.map(lambda doc: (demo_dir / doc[0]).write_bytes(doc[1]), _iter_demo_docs()))
     
-    return demo_dir
+    return demo_dir, written
 
 def run_demonstrations():
     """Run various demonstrations of the tool"""
-    print("🎯 Document Renamer - PDF Summary Feature Demo")
-    print("=" * 60)
+    # Static text is gathered per section and written to stdout in one call
+    out = StringIO()
+    out.write("🎯 Document Renamer - PDF Summary Feature Demo\n")
+    out.write(_BAR + "\n")
     
     # Create demo documents
-    print("\n1. Creating demo documents...")
-    demo_dir = create_demo_documents()
-    print(f"✅ Created {len(list(demo_dir.glob('*')))} demo documents in '{demo_dir}'")
+    out.write("\n1. Creating demo documents...\n")
+    sys.stdout.write(out.getvalue())
+    demo_dir, doc_count = create_demo_documents()
+    demo_path_str = str(demo_dir)
+    # One directory read; DirEntry caches the stat data for the listing below
+    with os.scandir(demo_path_str) as it:
+        doc_entries = [e for e in it if e.name.endswith((".txt", ".md"))]
     
     # Show original files
-    print(f"\n📁 Original files in {demo_dir}:")
-    for file_path in sorted(demo_dir.glob("*.txt")) + sorted(demo_dir.glob("*.md")):
-        size = file_path.stat().st_size
-        print(f"   📄 {file_path.name} ({size} bytes)")
-    
-    print("\n" + "=" * 60)
+    doc_entries.sort(key=lambda e: (e.name.endswith(".md"), e.name))  # .txt files first
+    out = StringIO()
+    out.write(f"✅ Created {doc_count} demo documents in '{demo_path_str}'\n")
+    out.write(f"\n📁 Original files in {demo_path_str}:\n")
+    out.write("\n".join(f"   📄 {e.name} ({e.stat().st_size} bytes)" for e in doc_entries) + "\n")
+    out.write("\n" + _BAR + "\n")
     
     # Demo 1: Create PDF summary without renaming
-    print("\n2. 📋 Creating PDF Summary (without renaming files)...")
-    print("   Command: python document_renamer.py demo_docs --summarize-only")
-    print("-" * 40)
+    out.write("\n2. 📋 Creating PDF Summary (without renaming files)...\n")
+    out.write(f"   Command: python document_renamer.py demo_docs --summarize-only --output {_DEMO_PDF}\n")
+    out.write(_THIN + "\n")
+    sys.stdout.write(out.getvalue())
     
-    os.system(f"python document_renamer.py {demo_dir} --summarize-only")
+    pdf_path_str = os.path.join(os.path.dirname(demo_path_str), _DEMO_PDF)
+    run_renamer(demo_path_str, "--summarize-only", "--output", pdf_path_str)
     
     # Show what was created
-    pdf_files = list(demo_dir.glob("*.pdf"))
-    if pdf_files:
-        pdf_file = pdf_files[0]
-        print(f"\n✅ PDF Summary created: {pdf_file.name}")
-        print(f"   📍 Location: {pdf_file.resolve()}")
-        print(f"   📊 Size: {pdf_file.stat().st_size:,} bytes")
-    
-    print("\n" + "=" * 60)
+    out = StringIO()
+    try:
+        pdf_size = os.stat(pdf_path_str).st_size
+    except FileNotFoundError:
+        pdf_size = None
+    if pdf_size is not None:
+        out.write(f"\n✅ PDF Summary created: {_DEMO_PDF}\n")
+        out.write(f"   📍 Location: {pdf_path_str}\n")
+        out.write(f"   📊 Size: {pdf_size:,} bytes\n")
+    
+    out.write("\n" + _BAR + "\n")
     
     # Demo 2: Show normal renaming functionality  
-    print("\n3. 📝 Normal Renaming Operation (dry run)...")
-    print("   Command: python document_renamer.py demo_docs --dry-run")
-    print("-" * 40)
+    out.write("\n3. 📝 Normal Renaming Operation (dry run)...\n")
+    out.write("   Command: python document_renamer.py demo_docs --dry-run\n")
+    out.write(_THIN + "\n")
+    sys.stdout.write(out.getvalue())
     
-    os.system(f"python document_renamer.py {demo_dir} --dry-run")
+    run_renamer(demo_path_str, "--dry-run")
     
-    print("\n" + "=" * 60)
+    out = StringIO()
+    out.write("\n" + _BAR + "\n")
     
     # Demo 3: Show help
-    print("\n4. 📚 Available Options:")
-    print("   Command: python document_renamer.py --help")
-    print("-" * 40)
+    out.write("\n4. 📚 Available Options:\n")
+    out.write("   Command: python document_renamer.py --help\n")
+    out.write(_THIN + "\n")
     
-    os.system("python document_renamer.py --help")
+    parser = build_parser()
+    parser.prog = "document_renamer.py"
+    out.write(parser.format_help())
     
-    print("\n" + "=" * 60)
+    out.write("\n" + _BAR + "\n")
     
     # Summary
-    print("\n🎉 Demo Complete! Key Features Demonstrated:")
-    print("   ✅ PDF Summary Generation (--summarize-only)")
-    print("   ✅ Document Analysis without File Changes")
-    print("   ✅ Professional PDF Output with Summaries")
-    print("   ✅ Compatible with ChatGPT API Integration")
-    print("   ✅ Normal File Renaming Functionality")
-    
-    print(f"\n📂 Demo files remain in: {demo_dir.resolve()}")
-    print("💡 To test with ChatGPT API:")
-    print("   python document_renamer.py demo_docs --summarize-only --openai-api-key 'your-key'")
-    
-    print("\n🚀 Ready for production use!")
+    out.write("\n🎉 Demo Complete! Key Features Demonstrated:\n")
+    out.write("   ✅ PDF Summary Generation (--summarize-only)\n")
+    out.write("   ✅ Document Analysis without File Changes\n")
+    out.write("   ✅ Professional PDF Output with Summaries\n")
+    out.write("   ✅ Compatible with ChatGPT API Integration\n")
+    out.write("   ✅ Normal File Renaming Functionality\n")
+    
+    out.write(f"\n📂 Demo files remain in: {demo_path_str}\n")
+    out.write("💡 To test with ChatGPT API:\n")
+    out.write("   python document_renamer.py demo_docs --summarize-only --openai-api-key 'your-key'\n")
+    
+    out.write("\n🚀 Ready for production use!\n")
+    sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
     run_demonstrations()
\ No newline at end of file
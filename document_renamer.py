@@ -6,18 +6,180 @@ Document Renamer - Renames documents with date prefix and provides summaries
 import os
 import sys
 import re
-import json
 import io
-import platform
-import shutil
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import argparse
-import json
+
+
+# Leading "YYYY.MM.DD_" prefix added by this tool
+_DATE_PREFIX_RE = re.compile(r'^\d{4}\.\d{2}\.\d{2}_')
+
+# Filename date patterns used by extract_date_from_filename
+_FILENAME_DATE_PATTERNS = [
+    re.compile(r'(\d{4})[._-](\d{1,2})[._-](\d{1,2})'),  # YYYY-MM-DD, YYYY_MM_DD, YYYY.MM.DD
+    re.compile(r'(\d{1,2})[._-](\d{1,2})[._-](\d{4})'),  # MM-DD-YYYY, MM_DD_YYYY, MM.DD.YYYY
+    re.compile(r'(\d{4})(\d{2})(\d{2})'),                # YYYYMMDD
+    re.compile(r'(\d{2})(\d{2})(\d{4})'),                # MMDDYYYY
+]
+
+# Filename date patterns used by extract_date_from_file (in order of preference)
+_FILENAME_PATTERNS = [
+    # ISO format and similar
+    (re.compile(r'(\d{4})[._-](\d{1,2})[._-](\d{1,2})'), 'ymd'),  # YYYY-MM-DD, YYYY_MM_DD, YYYY.MM.DD
+    (re.compile(r'(\d{4})(\d{2})(\d{2})'), 'ymd'),                # YYYYMMDD
+    # US format
+    (re.compile(r'(\d{1,2})[._-](\d{1,2})[._-](\d{4})'), 'mdy'),  # MM-DD-YYYY, MM_DD_YYYY, MM.DD.YYYY
+    (re.compile(r'(\d{2})(\d{2})(\d{4})'), 'mdy'),                # MMDDYYYY
+    # Alternative formats
+    (re.compile(r'(\d{1,2})[._-](\d{4})'), 'my'),                 # MM-YYYY (assume day 1)
+    (re.compile(r'(\d{4})[._-](\d{1,2})'), 'ym'),                 # YYYY-MM (assume day 1)
+]
+
+# Every filename pattern above needs a run of four digits (the year)
+_HAS_YEAR_DIGITS = re.compile(r'\d{4}')
+
+# Month names and abbreviations used when parsing content dates
+_MONTH_NAMES = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Content date patterns as (pattern, priority, date type), higher priority first.
+# month_name patterns capture (month word, day, year); the numeric ones capture
+# their three numbers in the order named by the type.
+_CONTENT_PRIORITY_PATTERNS = [
+    # Highest priority: specific creation/document date fields
+    (re.compile(r'(?i)(?:invoice\s+date|document\s+date|report\s+date|meeting\s+date|created):\s*([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})'), 100, 'month_name'),
+    (re.compile(r'(?i)(?:invoice\s+date|document\s+date|report\s+date|meeting\s+date|created):\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})'), 100, 'numeric_ymd'),
+    (re.compile(r'(?i)(?:invoice\s+date|document\s+date|report\s+date|meeting\s+date|created):\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})'), 100, 'numeric_mdy'),
+    
+    # High priority: generic "Date:" at start of line or with context
+    (re.compile(r'(?i)(?:^|\n|\s)date:\s*([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})'), 90, 'month_name'),
+    (re.compile(r'(?i)(?:^|\n|\s)date:\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})'), 90, 'numeric_ymd'),
+    (re.compile(r'(?i)(?:^|\n|\s)date:\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})'), 90, 'numeric_mdy'),
+    
+    # Medium-high priority: last updated field
+    (re.compile(r'(?i)(?:last\s+updated):\s*([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})'), 80, 'month_name'),
+    (re.compile(r'(?i)(?:last\s+updated):\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})'), 80, 'numeric_ymd'),
+    (re.compile(r'(?i)(?:last\s+updated):\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})'), 80, 'numeric_mdy'),
+    
+    # Medium priority: standalone month names near beginning of document
+    (re.compile(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})'), 50, 'month_name'),
+    
+    # Lower priority: due dates and other secondary dates
+    (re.compile(r'(?i)(?:due\s+date|next\s+meeting|deadline):\s*([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})'), 20, 'month_name'),
+    (re.compile(r'(?i)(?:due\s+date|next\s+meeting|deadline):\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})'), 20, 'numeric_ymd'),
+    (re.compile(r'(?i)(?:due\s+date|next\s+meeting|deadline):\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})'), 20, 'numeric_mdy'),
+    
+    # Lowest priority: numeric dates without context
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), 10, 'numeric_ymd'),
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), 5, 'numeric_mdy'),
+]
+
+# Opt-in cache of analysis results, one JSON file per folder in the user cache directory
+_CACHE_APP_DIR = 'document_renamer'
+_CACHE_VERSION = 1
+_CACHE_MISS = object()
+
+# Default chat model used for summaries; the model is part of the summary cache key
+_OPENAI_MODEL = 'gpt-3.5-turbo'
+
+# ChatGPT requests in flight at once unless --workers is given, and how often a
+# rate-limited (HTTP 429) request is retried before falling back to a local summary
+_OPENAI_DEFAULT_CONCURRENCY = 4
+_OPENAI_RATE_LIMIT_RETRIES = 3
+
+# PyMuPDF is not thread-safe and every OCR call starts a tesseract process, so
+# PDF and image extraction runs one file at a time across worker threads
+_EXTRACTION_LOCK = threading.Lock()
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif'})
+
+# Leading bytes of binary formats that are not scanned for dates
+_BINARY_SIGNATURES = (b'%PDF', b'PK\x03\x04', b'\x89PNG', b'\xff\xd8\xff', b'GIF8')
+
+# Every content date pattern needs at least one digit
+_HAS_DIGIT = re.compile(r'\d')
+
+# Every month name and abbreviation starts with one of these; month_name patterns
+# cannot produce a date in text that contains none of them
+_HAS_MONTH_WORD = re.compile(r'(?i)jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec')
+
+# Turns the '_' and '-' separators in a filename into spaces for display
+_SEPARATORS_TO_SPACES = str.maketrans('_-', '  ')
+
+# Characters stripped from filenames by sanitize_filename
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+# Lines starting with a numeric date are skipped by local summaries
+_DATE_LINE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+
+# Extensions read as plain text by the summary and classification helpers
+_TEXT_EXTENSIONS = frozenset({'.txt', '.md', '.csv', '.json', '.xml', '.html', '.htm', '.log'})
+
+# Date patterns removed from the end of filenames (YYYY.MM.DD_ prefixes are kept)
+_END_DATE_PATTERNS = [
+    re.compile(r'[._-](\d{4})[._-](\d{1,2})[._-](\d{1,2})$'),  # _YYYY-MM-DD, _YYYY_MM_DD, _YYYY.MM.DD at end
+    re.compile(r'[._-](\d{1,2})[._-](\d{1,2})[._-](\d{4})$'),  # _MM-DD-YYYY, _MM_DD_YYYY, _MM.DD.YYYY at end
+    re.compile(r'[._-](\d{4})(\d{2})(\d{2})$'),                # _YYYYMMDD at end
+    re.compile(r'[._-](\d{2})(\d{2})(\d{4})$'),                # _MMDDYYYY at end
+    re.compile(r'[._-](\d{1,2})[._-](\d{4})$'),                # _MM-YYYY at end
+    re.compile(r'[._-](\d{4})[._-](\d{1,2})$'),                # _YYYY-MM at end
+]
+
+
+def _user_cache_dir():
+    """Return the per-user cache directory for this tool (XDG_CACHE_HOME, LOCALAPPDATA or ~/.cache)"""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base and sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA')
+    return Path(base or Path.home() / '.cache') / _CACHE_APP_DIR
+
+
+def _valid_cache_entry(entry, signature):
+    """Check that a cache entry is a [signature, value] pair recorded for this file state"""
+    return isinstance(entry, list) and len(entry) == 2 and entry[0] == signature
+
+
+def _folder_name_key(folder_path, names):
+    """Return the function that maps a file name in folder_path to its collision key
+
+    Names that differ only in case are the same file on case-insensitive filesystems
+    (Windows, default macOS volumes) and distinct files elsewhere, so one cased name
+    from the listing is probed with its case swapped: casefold when both spellings
+    resolve to the same file, exact names otherwise (os.path.normcase when the
+    folder has no cased names to probe).
+    """
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name and swapped.swapcase() == name:
+            try:
+                if os.path.samefile(os.path.join(folder_path, name), os.path.join(folder_path, swapped)):
+                    return str.casefold
+            except OSError:
+                pass
+            return str
+    return os.path.normcase
+
+
+def _format_date_prefix(date):
+    """Format a date as YYYY.MM.DD; same result as strftime("%Y.%m.%d") without the locale machinery"""
+    return f"{date.year:04d}.{date.month:02d}.{date.day:02d}"
 
 
 class DocumentRenamer:
-    def __init__(self, folder_path, date_override=None, use_file_dates=True, openai_api_key=None):
+    def __init__(self, folder_path, date_override=None, use_file_dates=True, openai_api_key=None, workers=None,
+                 use_cache=False, verbose=True, openai_model=None):
         """
         Initialize the DocumentRenamer
         
@@ -26,10 +188,25 @@ class DocumentRenamer:
             date_override (str): Optional date override in YYYY-MM-DD format
             use_file_dates (bool): If True, extract dates from filenames
             openai_api_key (str): OpenAI API key for generating summaries
+            workers (int): Number of worker threads for per-file analysis (default: based on CPU count);
+                also the limit on concurrent ChatGPT requests (default: 4)
+            use_cache (bool): If True, reuse analysis results of unchanged files across runs
+                (kept in the user cache directory; call close_cache() to save them)
+            verbose (bool): If True, print per-file filename analysis messages
+            openai_model (str): OpenAI chat model for summaries (default: gpt-3.5-turbo)
         """
         self.folder_path = Path(folder_path)
         self.use_file_dates = use_file_dates
         self.openai_api_key = openai_api_key
+        self.openai_model = openai_model or _OPENAI_MODEL
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be a positive integer")
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        # ChatGPT requests share a smaller limit so the default pool stays
+        # within low OpenAI rate limits (see get_chatgpt_content_summary)
+        self.api_concurrency = workers or _OPENAI_DEFAULT_CONCURRENCY
+        self.use_cache = use_cache
+        self.verbose = verbose
         
         if date_override:
             try:
@@ -38,10 +215,32 @@ class DocumentRenamer:
                 raise ValueError("Date override must be in YYYY-MM-DD format")
         else:
             self.default_date = datetime.now()
+        self._default_date_prefix = _format_date_prefix(self.default_date)
         
         self.processed_files = []
         self.errors = []
         
+        # Summary document written by process_folder, so print_summary can reuse it
+        self._summary_path = None
+        
+        # Dates already extracted, so repeated lookups skip the file work
+        self._date_cache = {}
+        
+        # Content analysis results for this run, backed by the optional on-disk
+        # cache that is loaded on first use (see _cache_get / _cache_set)
+        self._memory_cache = {}
+        self._disk_cache = None
+        self._disk_cache_dirty = False
+        self._cache_lock = threading.Lock()
+        
+        # HTTP session shared by ChatGPT requests (see _openai_session)
+        self._http_session = None
+        self._http_session_lock = threading.Lock()
+        self._api_slots = threading.BoundedSemaphore(self.api_concurrency)
+        
+        # Pending progress messages while process_folder runs (see _log)
+        self._log_buffer = None
+        
         # Common date patterns to search for in documents
         self.date_patterns = [
             # Full month names
@@ -55,25 +254,111 @@ class DocumentRenamer:
             # Date: format
             r'[Dd]ate:\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
             r'[Dd]ate:\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
-            # ISO format
-            r'(\d{4})-(\d{2})-(\d{2})',
+            # ISO format (YYYY-MM-DD) is covered by the YYYY-MM-DD pattern above
         ]
     
+    def _cache_key(self, kind, file_path):
+        """Build a cache key for a file that changes whenever the file does"""
+        stat = os.stat(file_path)
+        return kind, os.path.abspath(file_path), [stat.st_mtime_ns, stat.st_size]
+    
+    def _cache_path(self):
+        """Return the JSON cache file for this folder"""
+        folder_id = hashlib.sha256(str(self.folder_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return _user_cache_dir() / f"{folder_id}.json"
+    
+    def _load_disk_cache(self):
+        """Load the on-disk cache on first use; returns None when caching is off"""
+        with self._cache_lock:
+            if self._disk_cache is None and self.use_cache:
+                self._disk_cache = {}
+                try:
+                    with open(self._cache_path(), 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if (isinstance(data, dict) and data.get('version') == _CACHE_VERSION
+                            and isinstance(data.get('files'), dict)):
+                        self._disk_cache = data['files']
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    print(f"Warning: ignoring unreadable analysis cache: {e}")
+            return self._disk_cache
+    
+    def _cache_get(self, key):
+        """Look a result up in memory, then on disk; returns _CACHE_MISS if absent"""
+        kind, path, signature = key
+        if (kind, path) in self._memory_cache:
+            cached_signature, value = self._memory_cache[(kind, path)]
+            if cached_signature == signature:
+                return value
+        
+        disk_cache = self._load_disk_cache()
+        if disk_cache is not None:
+            with self._cache_lock:
+                entries = disk_cache.get(path)
+                entry = entries.get(kind) if isinstance(entries, dict) else None
+            if _valid_cache_entry(entry, signature):
+                self._memory_cache[(kind, path)] = (signature, entry[1])
+                return entry[1]
+        
+        return _CACHE_MISS
+    
+    def _cache_set(self, key, value):
+        """Store a JSON-serializable result in memory and in the on-disk cache"""
+        kind, path, signature = key
+        self._memory_cache[(kind, path)] = (signature, value)
+        
+        disk_cache = self._load_disk_cache()
+        if disk_cache is not None:
+            with self._cache_lock:
+                disk_cache.setdefault(path, {})[kind] = [signature, value]
+                self._disk_cache_dirty = True
+    
+    def close_cache(self):
+        """Save new entries to the on-disk cache, dropping those of deleted or changed files"""
+        with self._cache_lock:
+            disk_cache, self._disk_cache = self._disk_cache, None
+            if disk_cache is None or not self._disk_cache_dirty:
+                return
+            self._disk_cache_dirty = False
+            
+            files = {}
+            for path, entries in disk_cache.items():
+                try:
+                    stat = os.stat(path)
+                except (OSError, TypeError, ValueError):
+                    continue
+                if not isinstance(entries, dict):
+                    continue
+                signature = [stat.st_mtime_ns, stat.st_size]
+                current = {kind: entry for kind, entry in entries.items()
+                           if _valid_cache_entry(entry, signature)}
+                if current:
+                    files[path] = current
+            
+            # Written to a temporary file first so an interrupted save keeps the old cache
+            cache_path = self._cache_path()
+            temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': _CACHE_VERSION, 'folder': str(self.folder_path.resolve()),
+                               'files': files}, f)
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                print(f"Warning: could not save analysis cache: {e}")
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    pass
+    
     def extract_date_from_filename(self, file_path):
         """Extract date from filename if present"""
         filename = file_path.name
         found_dates = []
         
-        # Common filename date patterns
-        filename_patterns = [
-            r'(\d{4})[._-](\d{1,2})[._-](\d{1,2})',  # YYYY-MM-DD, YYYY_MM_DD, YYYY.MM.DD
-            r'(\d{1,2})[._-](\d{1,2})[._-](\d{4})',  # MM-DD-YYYY, MM_DD_YYYY, MM.DD.YYYY
-            r'(\d{4})(\d{2})(\d{2})',                # YYYYMMDD
-            r'(\d{2})(\d{2})(\d{4})',                # MMDDYYYY
-        ]
-        
-        for pattern in filename_patterns:
-            matches = re.finditer(pattern, filename)
+        for pattern in _FILENAME_DATE_PATTERNS:
+            matches = pattern.finditer(filename)
             for match in matches:
                 groups = match.groups()
                 try:
@@ -101,25 +386,37 @@ class DocumentRenamer:
             datetime: Extracted date from filename or default date if none found
         """
         filename = file_path.name
-        found_dates = []
         
-        # Common filename date patterns (in order of preference)
-        filename_patterns = [
-            # ISO format and similar
-            (r'(\d{4})[._-](\d{1,2})[._-](\d{1,2})', 'ymd'),  # YYYY-MM-DD, YYYY_MM_DD, YYYY.MM.DD
-            (r'(\d{4})(\d{2})(\d{2})', 'ymd'),                # YYYYMMDD
-            # US format
-            (r'(\d{1,2})[._-](\d{1,2})[._-](\d{4})', 'mdy'),  # MM-DD-YYYY, MM_DD_YYYY, MM.DD.YYYY
-            (r'(\d{2})(\d{2})(\d{4})', 'mdy'),                # MMDDYYYY
-            # Alternative formats
-            (r'(\d{1,2})[._-](\d{4})', 'my'),                 # MM-YYYY (assume day 1)
-            (r'(\d{4})[._-](\d{1,2})', 'ym'),                 # YYYY-MM (assume day 1)
-        ]
+        if self.verbose:
+            self._log(f"Analyzing filename: {filename}")
+        
+        found_dates = self._find_filename_dates(filename)
+        if self.verbose:
+            for found_date in found_dates:
+                self._log(f"Found date {found_date.date().isoformat()} in filename")
         
-        print(f"Analyzing filename: {filename}")
+        if found_dates:
+            # Return the first valid date found (highest priority pattern)
+            return found_dates[0]
+        else:
+            if self.verbose:
+                self._log(f"No dates found in filename, using default date")
+            return self.default_date
+
+    def _find_filename_dates(self, filename):
+        """Return the valid dates in a filename, highest priority pattern first"""
+        if filename in self._date_cache:
+            return self._date_cache[filename]
         
-        for pattern, date_format in filename_patterns:
-            matches = re.finditer(pattern, filename)
+        found_dates = []
+        
+        # Cheap pre-filter: most filenames carry no date at all
+        if not _HAS_YEAR_DIGITS.search(filename):
+            self._date_cache[filename] = found_dates
+            return found_dates
+        
+        for pattern, date_format in _FILENAME_PATTERNS:
+            matches = pattern.finditer(filename)
             for match in matches:
                 groups = match.groups()
                 try:
@@ -134,138 +431,118 @@ class DocumentRenamer:
                     
                     # Validate date components
                     if 1 <= month <= 12 and 1 <= day <= 31 and 1900 <= year <= 2100:
-                        found_date = datetime(year, month, day)
-                        found_dates.append(found_date)
-                        print(f"Found date {found_date.strftime('%Y-%m-%d')} in filename")
+                        found_dates.append(datetime(year, month, day))
                 except (ValueError, IndexError):
                     continue
         
-        if found_dates:
-            # Return the first valid date found (highest priority pattern)
-            return found_dates[0]
-        else:
-            print(f"No dates found in filename, using default date")
-            return self.default_date
+        self._date_cache[filename] = found_dates
+        return found_dates
 
     def extract_dates_from_content(self, file_path):
         """Extract dates from document content with priority weighting"""
+        # With extraction disabled every file gets the default date; skip the read
+        if not self.use_file_dates:
+            return self.default_date
+        
         try:
-            # Read file content with different encodings
-            content = ""
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            
-            for encoding in encodings:
+            # Reuse the result for a file that has not changed since it was scanned.
+            # Dates are cached as ISO strings, and None for "no date", since the
+            # default date differs per run.
+            cache_key = self._cache_key('content-date', file_path)
+            found_date = self._cache_get(cache_key)
+            if found_date is not _CACHE_MISS:
+                found_date = found_date and datetime.fromisoformat(found_date)
+            else:
+                # Read the file once and decode it as a text-mode read would: UTF-8,
+                # else Latin-1, which maps every byte and so cannot fail
+                with open(file_path, 'rb') as f:
+                    # Binary formats (PDF, Office/ZIP, images) hold no scannable text
+                    head = f.read(8)
+                    if head.startswith(_BINARY_SIGNATURES) or b'\x00' in head:
+                        data = b''
+                    else:
+                        data = head + f.read()
+                
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    break
+                    content = data.decode('utf-8')
                 except UnicodeDecodeError:
-                    continue
-            
-            if not content:
-                return self.default_date
-            
-            # Search for dates with priority weighting
-            found_dates = []
-            
-            # Priority patterns (higher priority first)
-            priority_patterns = [
-                # Highest priority: specific creation/document date fields
-                (r'(?i)(?:invoice\s+date|document\s+date|report\s+date|meeting\s+date|created):\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})', 100, 'month_name'),
-                (r'(?i)(?:invoice\s+date|document\s+date|report\s+date|meeting\s+date|created):\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})', 100, 'numeric_ymd'),
-                (r'(?i)(?:invoice\s+date|document\s+date|report\s+date|meeting\s+date|created):\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})', 100, 'numeric_mdy'),
-                
-                # High priority: generic "Date:" at start of line or with context
-                (r'(?i)(?:^|\n|\s)date:\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})', 90, 'month_name'),
-                (r'(?i)(?:^|\n|\s)date:\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})', 90, 'numeric_ymd'),
-                (r'(?i)(?:^|\n|\s)date:\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})', 90, 'numeric_mdy'),
+                    content = data.decode('latin-1')
                 
-                # Medium-high priority: last updated field
-                (r'(?i)(?:last\s+updated):\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})', 80, 'month_name'),
-                (r'(?i)(?:last\s+updated):\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})', 80, 'numeric_ymd'),
-                (r'(?i)(?:last\s+updated):\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})', 80, 'numeric_mdy'),
+                # Same newline translation as a text-mode read, so match positions
+                # (the early-date boost) count the same characters
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
                 
-                # Medium priority: standalone month names near beginning of document
-                (r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})', 50, 'month_name'),
-                
-                # Lower priority: due dates and other secondary dates
-                (r'(?i)(?:due\s+date|next\s+meeting|deadline):\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})', 20, 'month_name'),
-                (r'(?i)(?:due\s+date|next\s+meeting|deadline):\s*(\d{4})[/-](\d{1,2})[/-](\d{1,2})', 20, 'numeric_ymd'),
-                (r'(?i)(?:due\s+date|next\s+meeting|deadline):\s*(\d{1,2})[/-](\d{1,2})[/-](\d{4})', 20, 'numeric_mdy'),
+                found_date = self._find_content_date(content)
+                self._cache_set(cache_key, found_date and found_date.isoformat())
+            
+            return found_date or self.default_date
                 
-                # Lowest priority: numeric dates without context
-                (r'(\d{4})-(\d{2})-(\d{2})', 10, 'numeric_ymd'),
-                (r'(\d{1,2})/(\d{1,2})/(\d{4})', 5, 'numeric_mdy'),
-            ]
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+            return self.default_date
+
+    def _find_content_date(self, content):
+        """Return the highest priority date found in content, or None"""
+        if not content:
+            return None
+        
+        # Cheap pre-filters: text without any digit cannot contain a date, and
+        # text without a month word cannot contain a month_name date
+        if not _HAS_DIGIT.search(content):
+            return None
+        has_month_word = _HAS_MONTH_WORD.search(content) is not None
+        
+        # Search for dates with priority weighting, keeping only the best
+        # (priority, date) seen so far; ties go to the most recent date
+        best = None
+        
+        for pattern, priority, date_type in _CONTENT_PRIORITY_PATTERNS:
+            # Patterns run in descending priority, so once the best score is out of
+            # reach of this pattern's boosted priority, no later pattern can win either
+            if best is not None and best[0] > priority + 20:
+                break
             
-            month_names = {
-                'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
-                'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-            }
+            if date_type == 'month_name' and not has_month_word:
+                continue
             
-            for pattern, priority, date_type in priority_patterns:
-                matches = re.finditer(pattern, content)
+            for match in pattern.finditer(content):
+                # Boost priority if found in first 200 characters
+                pos_boost = 20 if match.start() < 200 else 0
                 
-                for match in matches:
-                    try:
-                        if date_type == 'month_name':
-                            # Extract month name pattern
-                            if priority >= 50:  # Patterns with labels or high priority
-                                if priority >= 80:  # Highest priority patterns with labels
-                                    date_text = match.group(1)
-                                else:  # Standalone month patterns
-                                    date_text = match.group(0)
-                            else:  # Lower priority patterns
-                                date_text = match.group(1) if len(match.groups()) > 0 else match.group(0)
-                            
-                            # Parse month name format
-                            parts = date_text.strip().split()
-                            if len(parts) >= 3:
-                                month_name = parts[0].lower().replace(',', '')
-                                if month_name in month_names:
-                                    day = int(parts[1].replace(',', ''))
-                                    year = int(parts[2])
-                                    
-                                    found_date = datetime(year, month_names[month_name], day)
-                                    
-                                    # Boost priority if found in first 200 characters
-                                    pos_boost = 20 if match.start() < 200 else 0
-                                    found_dates.append((found_date, priority + pos_boost))
-                        
-                        elif date_type == 'numeric_ymd':
-                            groups = match.groups()
-                            if len(groups) >= 3:
-                                year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                                found_date = datetime(year, month, day)
-                                
-                                pos_boost = 20 if match.start() < 200 else 0
-                                found_dates.append((found_date, priority + pos_boost))
-                        
-                        elif date_type == 'numeric_mdy':
-                            groups = match.groups()
-                            if len(groups) >= 3:
-                                month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
-                                found_date = datetime(year, month, day)
-                                
-                                pos_boost = 20 if match.start() < 200 else 0
-                                found_dates.append((found_date, priority + pos_boost))
+                # Matches come in order, so past the boost window this pattern
+                # can no longer beat or tie the best date
+                if not pos_boost and best is not None and best[0] > priority:
+                    break
+                
+                groups = match.groups()
+                
+                try:
+                    found_date = None
                     
-                    except (ValueError, IndexError):
-                        continue
-            
-            # Return the highest priority date, or most recent if tied
-            if found_dates:
-                # Sort by priority (descending), then by date (descending)
-                found_dates.sort(key=lambda x: (x[1], x[0]), reverse=True)
-                return found_dates[0][0]
-            else:
-                return self.default_date
+                    if date_type == 'month_name':
+                        # Month word, day and year are captured separately
+                        month = _MONTH_NAMES.get(groups[0].lower())
+                        if month:
+                            found_date = datetime(int(groups[2]), month, int(groups[1]))
+                    
+                    elif date_type == 'numeric_ymd':
+                        year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
+                        found_date = datetime(year, month, day)
+                    
+                    elif date_type == 'numeric_mdy':
+                        month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
+                        found_date = datetime(year, month, day)
                 
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
-            return self.default_date
+                except (ValueError, IndexError):
+                    continue
+                
+                if found_date is not None:
+                    candidate = (priority + pos_boost, found_date)
+                    if best is None or candidate > best:
+                        best = candidate
+        
+        # Return the highest priority date, if any was found
+        return best[1] if best else None
 
     def is_valid_file(self, file_path):
         """
@@ -283,17 +560,29 @@ class DocumentRenamer:
         if file_path.is_dir():
             return False
         # Skip files that already have date prefix pattern
-        if re.match(r'^\d{4}\.\d{2}\.\d{2}_', file_path.name):
+        if _DATE_PREFIX_RE.match(file_path.name):
             return False
         
         return True
     
-    def remove_date_from_filename(self, file_path):
+    def _plan_date_removal(self, name_part):
+        """Return (removed date text, remaining name) for a name ending in a date, or None"""
+        for pattern in _END_DATE_PATTERNS:
+            match = pattern.search(name_part)
+            if match:
+                # Clean up any trailing separators
+                return match.group(0), name_part[:match.start()].rstrip('._-')
+        return None
+    
+    def remove_date_from_filename(self, file_path, existing_names=None, name_key=os.path.normcase):
         """
         Remove date patterns from the end of a filename (keeps YYYY.MM.DD_ prefix at beginning)
         
         Args:
             file_path (Path): Path to the file
+            existing_names (set): Optional name_key() of every name already in the folder;
+                used instead of probing the filesystem and updated after the rename
+            name_key (callable): Maps a file name to its collision key in this folder
             
         Returns:
             tuple: (success, old_name, new_name, error_message)
@@ -303,39 +592,27 @@ class DocumentRenamer:
             name_part = file_path.stem  # filename without extension
             extension = file_path.suffix
             
-            # Patterns to remove from the end of filenames ONLY
-            end_date_patterns = [
-                r'[._-](\d{4})[._-](\d{1,2})[._-](\d{1,2})$',  # _YYYY-MM-DD, _YYYY_MM_DD, _YYYY.MM.DD at end
-                r'[._-](\d{1,2})[._-](\d{1,2})[._-](\d{4})$',  # _MM-DD-YYYY, _MM_DD_YYYY, _MM.DD.YYYY at end
-                r'[._-](\d{4})(\d{2})(\d{2})$',                # _YYYYMMDD at end
-                r'[._-](\d{2})(\d{2})(\d{4})$',                # _MMDDYYYY at end
-                r'[._-](\d{1,2})[._-](\d{4})$',                # _MM-YYYY at end
-                r'[._-](\d{4})[._-](\d{1,2})$',                # _YYYY-MM at end
-                # Note: Removed the beginning pattern - we want to KEEP YYYY.MM.DD_ prefixes
-            ]
-            
-            new_name_part = name_part
-            date_removed = False
-            
-            print(f"Analyzing filename for end date removal: {filename}")
+            if self.verbose:
+                print(f"Analyzing filename for end date removal: {filename}")
             
-            for pattern in end_date_patterns:
-                match = re.search(pattern, new_name_part)
-                if match:
-                    print(f"Found end date pattern to remove: {match.group(0)}")
-                    new_name_part = re.sub(pattern, '', new_name_part)
-                    date_removed = True
-                    break
-            
-            # Clean up any trailing separators
-            new_name_part = new_name_part.rstrip('._-')
+            plan = self._plan_date_removal(name_part)
+            if plan:
+                removed_date, new_name_part = plan
+                if self.verbose:
+                    print(f"Found end date pattern to remove: {removed_date}")
             
-            if date_removed and new_name_part:
+            if plan and new_name_part:
                 new_filename = f"{new_name_part}{extension}"
                 new_path = file_path.parent / new_filename
                 
                 # Check if new filename already exists
-                if new_path.exists():
+                if existing_names is not None:
+                    counter = 1
+                    while name_key(new_filename) in existing_names:
+                        new_filename = f"{new_name_part}_{counter}{extension}"
+                        counter += 1
+                    new_path = file_path.parent / new_filename
+                elif new_path.exists():
                     counter = 1
                     while new_path.exists():
                         new_filename = f"{new_name_part}_{counter}{extension}"
@@ -344,7 +621,12 @@ class DocumentRenamer:
                 
                 # Rename the file
                 file_path.rename(new_path)
-                print(f"Removed end date from filename: {filename} -> {new_filename}")
+                
+                if existing_names is not None:
+                    existing_names.discard(name_key(filename))
+                    existing_names.add(name_key(new_filename))
+                if self.verbose:
+                    print(f"Removed end date from filename: {filename} -> {new_filename}")
                 
                 return True, filename, new_filename, None
             else:
@@ -368,8 +650,18 @@ class DocumentRenamer:
             print(f"Error: '{self.folder_path}' is not a directory.")
             return
         
-        # Get all files in the folder (don't use is_valid_file since we want to process all files)
-        files = [f for f in self.folder_path.iterdir() if f.is_file() and not f.name.startswith('.')]
+        # Get all files in the folder (don't use is_valid_file since we want to process all files).
+        # The same pass records every name so renames can avoid collisions
+        # without probing the filesystem for each candidate name.
+        files = []
+        names = []
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                names.append(entry.name)
+                if entry.is_file() and not entry.name.startswith('.'):
+                    files.append(Path(entry.path))
+        name_key = _folder_name_key(self.folder_path, names)
+        existing_names = set(map(name_key, names))
         
         if not files:
             print(f"No files to process in '{self.folder_path}'")
@@ -385,31 +677,13 @@ class DocumentRenamer:
             if dry_run:
                 # Show what would be done
                 filename = file_path.name
-                name_part = file_path.stem
-                extension = file_path.suffix
                 
                 # Check for end date patterns (keep beginning YYYY.MM.DD_ prefixes)
-                end_date_patterns = [
-                    r'[._-](\d{4})[._-](\d{1,2})[._-](\d{1,2})$',
-                    r'[._-](\d{1,2})[._-](\d{1,2})[._-](\d{4})$',
-                    r'[._-](\d{4})(\d{2})(\d{2})$',
-                    r'[._-](\d{2})(\d{2})(\d{4})$',
-                    r'[._-](\d{1,2})[._-](\d{4})$',
-                    r'[._-](\d{4})[._-](\d{1,2})$',
-                    # Note: Not removing YYYY.MM.DD_ prefixes at beginning
-                ]
-                
-                new_name_part = name_part
-                date_found = False
-                
-                for pattern in end_date_patterns:
-                    if re.search(pattern, new_name_part):
-                        new_name_part = re.sub(pattern, '', new_name_part).rstrip('._-')
-                        date_found = True
-                        break
+                plan = self._plan_date_removal(file_path.stem)
+                new_name_part = plan[1] if plan else None
                 
-                if date_found and new_name_part:
-                    new_filename = f"{new_name_part}{extension}"
+                if new_name_part:
+                    new_filename = f"{new_name_part}{file_path.suffix}"
                     print(f"Would rename: {filename}")
                     print(f"         to: {new_filename}")
                     print()
@@ -418,7 +692,7 @@ class DocumentRenamer:
                     print()
             else:
                 # Actually remove dates
-                success, old_name, new_name, error = self.remove_date_from_filename(file_path)
+                success, old_name, new_name, error = self.remove_date_from_filename(file_path, existing_names, name_key)
                 
                 if success:
                     print(f"✓ {old_name} -> {new_name}")
@@ -447,32 +721,26 @@ class DocumentRenamer:
         Returns:
             str: Sanitized filename
         """
-        # Replace spaces with underscores and remove problematic characters
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = filename
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '')
+        # Remove problematic characters and replace spaces with underscores
+        sanitized = filename.translate(_INVALID_FILENAME_CHARS).replace(' ', '_')
         
-        # Replace spaces with underscores
-        sanitized = sanitized.replace(' ', '_')
-        
-        # Remove multiple consecutive underscores
-        while '__' in sanitized:
-            sanitized = sanitized.replace('__', '_')
-        
-        return sanitized
+        # Collapse runs of underscores into one
+        return _MULTI_UNDERSCORE_RE.sub('_', sanitized)
     
-    def get_file_summary(self, file_path):
+    def get_file_summary(self, file_path, stat_result=None):
         """
         Generate a brief summary of the file
         
         Args:
             file_path (Path): Path to the file
+            stat_result (os.stat_result): Optional stat of the file, to avoid another stat call
             
         Returns:
             str: Brief summary of the file
         """
-        file_size = file_path.stat().st_size
+        if stat_result is None:
+            stat_result = file_path.stat()
+        file_size = stat_result.st_size
         file_ext = file_path.suffix.upper()
         
         # Convert size to human readable format
@@ -485,12 +753,15 @@ class DocumentRenamer:
         
         return f"{file_ext} file, {size_str}"
     
-    def rename_file(self, file_path):
+    def rename_file(self, file_path, existing_names=None, name_key=os.path.normcase):
         """
         Rename a single file with the date prefix extracted from content
         
         Args:
             file_path (Path): Path to the file to rename
+            existing_names (set): Optional name_key() of every name already in the folder;
+                used instead of probing the filesystem and updated after the rename
+            name_key (callable): Maps a file name to its collision key in this folder
             
         Returns:
             tuple: (success, old_name, new_name, error_message, extracted_date)
@@ -499,10 +770,10 @@ class DocumentRenamer:
             # Extract date from file content if enabled
             if self.use_file_dates:
                 extracted_date = self.extract_date_from_file(file_path)
-                date_prefix = extracted_date.strftime("%Y.%m.%d")
+                date_prefix = _format_date_prefix(extracted_date)
             else:
                 extracted_date = self.default_date
-                date_prefix = self.default_date.strftime("%Y.%m.%d")
+                date_prefix = self._default_date_prefix
             
             # Get the original filename without path
             original_name = file_path.stem
@@ -516,7 +787,13 @@ class DocumentRenamer:
             new_path = file_path.parent / new_filename
             
             # Check if new filename already exists
-            if new_path.exists():
+            if existing_names is not None:
+                counter = 1
+                while name_key(new_filename) in existing_names:
+                    new_filename = f"{date_prefix}_{sanitized_name}_{counter}{file_extension}"
+                    counter += 1
+                new_path = file_path.parent / new_filename
+            elif new_path.exists():
                 counter = 1
                 while new_path.exists():
                     new_filename = f"{date_prefix}_{sanitized_name}_{counter}{file_extension}"
@@ -526,6 +803,10 @@ class DocumentRenamer:
             # Rename the file
             file_path.rename(new_path)
             
+            if existing_names is not None:
+                existing_names.discard(name_key(file_path.name))
+                existing_names.add(name_key(new_filename))
+            
             return True, file_path.name, new_filename, None, extracted_date
             
         except Exception as e:
@@ -547,8 +828,21 @@ class DocumentRenamer:
             print(f"Error: '{self.folder_path}' is not a directory.")
             return
         
-        # Get all files in the folder
-        files = [f for f in self.folder_path.iterdir() if self.is_valid_file(f)]
+        # Get all files in the folder; DirEntry answers is_dir() from the directory
+        # listing, so this applies is_valid_file's checks without a stat per entry.
+        # The same pass records every name so renames can avoid collisions
+        # without probing the filesystem for each candidate name.
+        files = []
+        names = []
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                names.append(entry.name)
+                if (not entry.name.startswith('.')
+                        and not entry.is_dir()
+                        and not _DATE_PREFIX_RE.match(entry.name)):
+                    files.append(entry)
+        name_key = _folder_name_key(self.folder_path, names)
+        existing_names = set(map(name_key, names))
         
         if not files:
             print(f"No files to process in '{self.folder_path}'")
@@ -558,119 +852,166 @@ class DocumentRenamer:
         print(f"{'DRY RUN - ' if dry_run else ''}Processing {len(files)} files in '{self.folder_path}' ({date_source})")
         print("=" * 80)
         
-        for file_path in files:
-            if dry_run:
-                # Show what would be done
-                if self.use_file_dates:
-                    extracted_date = self.extract_date_from_file(file_path)
-                    date_prefix = extracted_date.strftime("%Y.%m.%d")
-                else:
-                    extracted_date = self.default_date
-                    date_prefix = self.default_date.strftime("%Y.%m.%d")
-                
-                original_name = file_path.stem
-                sanitized_name = self.sanitize_filename(original_name)
-                new_filename = f"{date_prefix}_{sanitized_name}{file_path.suffix}"
-                summary = self.get_file_summary(file_path)
-                
-                print(f"Would rename: {file_path.name}")
-                print(f"         to: {new_filename} ({summary}) [Date: {extracted_date.strftime('%Y-%m-%d')}]")
-                print()
-                
-                # Store for potential summary creation
-                self.processed_files.append((file_path.name, new_filename, extracted_date))
-            else:
-                # Actually rename the file
-                success, old_name, new_name, error, extracted_date = self.rename_file(file_path)
-                
-                if success:
-                    # Get summary of the renamed file
-                    new_path = self.folder_path / new_name
-                    summary = self.get_file_summary(new_path)
+        # Analyze files concurrently; output and renames stay on this thread, in order
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            analyses = list(executor.map(self._analyze_file, files))
+        
+        # Per-file messages are collected and written in one go after the loop
+        self._log_buffer = []
+        try:
+            for file_path, stat_result in analyses:
+                if dry_run:
+                    # Show what would be done
+                    if self.use_file_dates:
+                        extracted_date = self.extract_date_from_file(file_path)
+                        date_prefix = _format_date_prefix(extracted_date)
+                    else:
+                        extracted_date = self.default_date
+                        date_prefix = self._default_date_prefix
                     
-                    print(f"Renamed: {new_name}")
-                    print(f"Summary: {summary} [Date extracted: {extracted_date.strftime('%Y-%m-%d')}]")
-                    print()
+                    original_name = file_path.stem
+                    sanitized_name = self.sanitize_filename(original_name)
+                    new_filename = f"{date_prefix}_{sanitized_name}{file_path.suffix}"
+                    summary = self.get_file_summary(file_path, stat_result)
                     
-                    self.processed_files.append((old_name, new_name, extracted_date))
+                    self._log(f"Would rename: {file_path.name}")
+                    self._log(f"         to: {new_filename} ({summary}) [Date: {extracted_date.date().isoformat()}]")
+                    self._log()
+                    
+                    # Store for potential summary creation
+                    self.processed_files.append((file_path.name, new_filename, extracted_date))
                 else:
-                    print(f"Error renaming '{old_name}': {error}")
-                    print()
-                    self.errors.append((old_name, error))
+                    # Actually rename the file
+                    success, old_name, new_name, error, extracted_date = self.rename_file(file_path, existing_names, name_key)
+                    
+                    if success:
+                        # Get summary of the renamed file; a rename keeps the size,
+                        # so the stat taken before it is still accurate
+                        new_path = self.folder_path / new_name
+                        summary = self.get_file_summary(new_path, stat_result)
+                        
+                        self._log(f"Renamed: {new_name}")
+                        self._log(f"Summary: {summary} [Date extracted: {extracted_date.date().isoformat()}]")
+                        self._log()
+                        
+                        self.processed_files.append((old_name, new_name, extracted_date))
+                    else:
+                        self._log(f"Error renaming '{old_name}': {error}")
+                        self._log()
+                        self.errors.append((old_name, error))
+        finally:
+            self._flush_log()
         
         # Create summary document if requested and files were processed
         if create_summary and self.processed_files:
             summary_path = self.create_summary_document()
+            self._summary_path = summary_path
             if summary_path:
                 print(f"{'DRY RUN - ' if dry_run else ''}Summary document created: {summary_path.name}")
                 if dry_run:
                     print("(Summary document will be created during actual run)")
                 print()
     
+    def _log(self, message=""):
+        """Print a progress message, or buffer it while a folder is being processed"""
+        if self._log_buffer is None:
+            print(message)
+        else:
+            self._log_buffer.append(message)
+    
+    def _flush_log(self):
+        """Write buffered progress messages in a single call and stop buffering"""
+        if self._log_buffer:
+            sys.stdout.write("\n".join(self._log_buffer) + "\n")
+            sys.stdout.flush()
+        self._log_buffer = None
+    
+    def _analyze_file(self, entry):
+        """Collect a directory entry's filename dates and stat ahead of processing; safe to run in a worker thread"""
+        if self.use_file_dates:
+            self._find_filename_dates(entry.name)
+        try:
+            # DirEntry.stat() is cached on the entry and comes from the listing on Windows
+            stat_result = entry.stat()
+        except OSError:
+            stat_result = None
+        return Path(entry.path), stat_result
+    
     def create_summary_document(self):
         """Create a summary document with all processed files and their 3-sentence summaries"""
         if not self.processed_files:
             return None
         
-        summary_filename = f"{datetime.now().strftime('%Y.%m.%d')}_Document_Summary.md"
+        date_stamp = _format_date_prefix(datetime.now())
+        summary_filename = f"{date_stamp}_Document_Summary.md"
         summary_path = self.folder_path / summary_filename
         
         # Avoid overwriting existing summary
         counter = 1
         while summary_path.exists():
-            summary_filename = f"{datetime.now().strftime('%Y.%m.%d')}_Document_Summary_{counter}.md"
+            summary_filename = f"{date_stamp}_Document_Summary_{counter}.md"
             summary_path = self.folder_path / summary_filename
             counter += 1
         
         try:
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write("# Document Summary\n\n")
-                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"**Folder:** `{self.folder_path}`\n")
-                f.write(f"**Files Processed:** {len(self.processed_files)}\n\n")
-                f.write("---\n\n")
-                
-                for i, (old_name, new_name, extracted_date) in enumerate(self.processed_files, 1):
-                    # Get file details
-                    file_path = self.folder_path / new_name
-                    if file_path.exists():
-                        # Extract title from filename (remove date prefix and extension)
-                        title_part = new_name
-                        if re.match(r'^\d{4}\.\d{2}\.\d{2}_', title_part):
-                            title_part = title_part[11:]  # Remove "YYYY.MM.DD_"
-                        title_part = Path(title_part).stem  # Remove extension
-                        title = title_part.replace('_', ' ')  # Convert underscores back to spaces
-                        
-                        f.write(f"## {title}\n\n")
-                        f.write(f"**File:** `{new_name}`\n")
-                        f.write(f"**Date:** {extracted_date.strftime('%Y-%m-%d')}\n\n")
-                        
-                        # Get 3-sentence summary
-                        try:
-                            summary_sentences = self.get_document_summary(file_path)
-                            f.write(f"**Summary:**\n")
-                            for j, sentence in enumerate(summary_sentences, 1):
-                                f.write(f"{j}. {sentence}\n")
-                            f.write("\n")
-                        except Exception as e:
-                            f.write(f"**Summary:** Unable to generate summary - {str(e)}\n\n")
-                        
-                        f.write("---\n\n")
+            parts = []
+            append = parts.append
+            append("# Document Summary\n\n")
+            append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            append(f"**Folder:** `{self.folder_path}`\n")
+            append(f"**Files Processed:** {len(self.processed_files)}\n\n")
+            append("---\n\n")
+            
+            # Files that still exist under their new name get a section
+            documents = []
+            for old_name, new_name, extracted_date in self.processed_files:
+                file_path = self.folder_path / new_name
+                if file_path.exists():
+                    documents.append((new_name, extracted_date, file_path))
+            
+            # Generate the summaries concurrently so file reads and API calls overlap
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                summaries = list(executor.map(self._try_document_summary,
+                                              [file_path for _, _, file_path in documents]))
+            
+            for (new_name, extracted_date, file_path), (summary_sentences, error) in zip(documents, summaries):
+                # Extract title from filename (remove date prefix and extension)
+                title_part = new_name
+                if _DATE_PREFIX_RE.match(title_part):
+                    title_part = title_part[11:]  # Remove "YYYY.MM.DD_"
+                title_part = Path(title_part).stem  # Remove extension
+                title = title_part.replace('_', ' ')  # Convert underscores back to spaces
                 
-                # Add statistics at the end
-                f.write("## Summary Statistics\n\n")
-                f.write(f"- **Total Documents:** {len(self.processed_files)}\n")
+                append(f"## {title}\n\n")
+                append(f"**File:** `{new_name}`\n")
+                append(f"**Date:** {extracted_date.date().isoformat()}\n\n")
                 
-                # Group by year
-                years = {}
-                for _, _, date in self.processed_files:
-                    year = date.year
-                    years[year] = years.get(year, 0) + 1
+                # Get 3-sentence summary
+                if error is None:
+                    append(f"**Summary:**\n")
+                    for j, sentence in enumerate(summary_sentences, 1):
+                        append(f"{j}. {sentence}\n")
+                    append("\n")
+                else:
+                    append(f"**Summary:** Unable to generate summary - {error}\n\n")
                 
-                if years:
-                    f.write(f"- **Documents by Year:**\n")
-                    for year in sorted(years.keys()):
-                        f.write(f"  - {year}: {years[year]} documents\n")
+                append("---\n\n")
+            
+            # Add statistics at the end
+            append("## Summary Statistics\n\n")
+            append(f"- **Total Documents:** {len(self.processed_files)}\n")
+            
+            # Group by year
+            years = Counter(date.year for _, _, date in self.processed_files)
+            
+            if years:
+                append(f"- **Documents by Year:**\n")
+                for year, count in sorted(years.items()):
+                    append(f"  - {year}: {count} documents\n")
+            
+            # Write the whole document in one call
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
             
             return summary_path
             
@@ -678,6 +1019,13 @@ class DocumentRenamer:
             print(f"Error creating summary document: {e}")
             return None
     
+    def _try_document_summary(self, file_path):
+        """Return (summary sentences, None), or (None, error text) if summarizing fails"""
+        try:
+            return self.get_document_summary(file_path), None
+        except Exception as e:
+            return None, str(e)
+    
     def get_chatgpt_content_summary(self, file_path):
         """Use ChatGPT API to generate a concise content summary"""
         if not self.openai_api_key:
@@ -690,16 +1038,22 @@ class DocumentRenamer:
             return self.get_local_content_summary(file_path)
         
         try:
+            # Only API answers are cached, so failed calls are retried on the next run
+            cache_key = self._cache_key(f'summary-chatgpt-{self.openai_model}', file_path)
+            cached_summary = self._cache_get(cache_key)
+            if cached_summary is not _CACHE_MISS:
+                return cached_summary
+            
             file_extension = file_path.suffix.lower()
             filename = file_path.stem
             
             # Remove date prefix from filename for cleaner analysis
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}_', filename):
+            if _DATE_PREFIX_RE.match(filename):
                 clean_filename = filename[11:]
             else:
                 clean_filename = filename
             
-            clean_filename = clean_filename.replace('_', ' ').replace('-', ' ')
+            clean_filename = clean_filename.translate(_SEPARATORS_TO_SPACES)
             
             # Extract text content using our comprehensive extraction method
             content = self.extract_text_from_file(file_path)
@@ -723,14 +1077,9 @@ File type: {file_extension.upper()}
 
 Provide a concise description of what this document probably contains based on its name and type."""
             
-            # Make API call to OpenAI
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
+            # Make API call to OpenAI; the session carries the auth header
             data = {
-                'model': 'gpt-3.5-turbo',
+                'model': self.openai_model,
                 'messages': [
                     {
                         'role': 'user',
@@ -741,12 +1090,7 @@ Provide a concise description of what this document probably contains based on i
                 'temperature': 0.3
             }
             
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=30
-            )
+            response = self._post_chat_completion(data)
             
             if response.status_code == 200:
                 result = response.json()
@@ -756,10 +1100,15 @@ Provide a concise description of what this document probably contains based on i
                 summary = summary.replace('"', '').strip()
                 
                 if summary and len(summary) > 10:
+                    self._cache_set(cache_key, summary)
                     return summary
                 else:
                     return self.get_local_content_summary(file_path)
             
+            elif response.status_code == 429:
+                print("OpenAI API error: 429 (rate limit still reached after retries)")
+                return self.get_local_content_summary(file_path)
+            
             else:
                 print(f"OpenAI API error: {response.status_code}")
                 return self.get_local_content_summary(file_path)
@@ -768,6 +1117,41 @@ Provide a concise description of what this document probably contains based on i
             print(f"Error calling ChatGPT API: {e}")
             return self.get_local_content_summary(file_path)
 
+    def _post_chat_completion(self, data):
+        """Send a chat completion request, waiting and retrying while rate limited"""
+        with self._api_slots:
+            for attempt in range(_OPENAI_RATE_LIMIT_RETRIES + 1):
+                response = self._openai_session().post(
+                    'https://api.openai.com/v1/chat/completions',
+                    json=data,
+                    timeout=30
+                )
+                if response.status_code != 429 or attempt == _OPENAI_RATE_LIMIT_RETRIES:
+                    return response
+                
+                # Honour Retry-After when the API sends it, otherwise back off exponentially
+                try:
+                    delay = min(max(float(response.headers.get('Retry-After', '')), 0.0), 60.0)
+                except ValueError:
+                    delay = 2.0 ** attempt
+                print(f"OpenAI rate limit reached, retrying in {delay:g}s...")
+                time.sleep(delay)
+
+    def _openai_session(self):
+        """Return the HTTP session shared by ChatGPT requests, creating it on first use"""
+        import requests
+        
+        with self._http_session_lock:
+            if self._http_session is None:
+                # Keep-alive connections skip the TCP/TLS handshake on every call after
+                # the first; one pooled connection per concurrent request
+                session = requests.Session()
+                session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=self.api_concurrency))
+                # Sent with every request; json= bodies set Content-Type themselves
+                session.headers['Authorization'] = f'Bearer {self.openai_api_key}'
+                self._http_session = session
+            return self._http_session
+
     def configure_tesseract_path(self):
         """Configure Tesseract OCR path for different operating systems"""
         try:
@@ -845,7 +1229,7 @@ Provide a concise description of what this document probably contains based on i
         
         try:
             # Text-based files
-            if file_extension in {'.txt', '.md', '.csv', '.json', '.xml', '.html', '.htm', '.log'}:
+            if file_extension in _TEXT_EXTENSIONS:
                 try:
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                         content = f.read(2000)
@@ -853,75 +1237,77 @@ Provide a concise description of what this document probably contains based on i
                     pass
             
             # Image files - use OCR
-            elif file_extension in {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif'}:
-                try:
-                    import pytesseract
-                    from PIL import Image
+            elif file_extension in _IMAGE_EXTENSIONS:
+                with _EXTRACTION_LOCK:
+                    try:
+                        import pytesseract
+                        from PIL import Image
                     
-                    # Configure Tesseract path if not in PATH
-                    self.configure_tesseract_path()
+                        # Configure Tesseract path if not in PATH
+                        self.configure_tesseract_path()
                     
-                    print(f"      🔍 Running OCR on image...")
-                    image = Image.open(file_path)
-                    content = pytesseract.image_to_string(image)[:2000]
-                except ImportError:
-                    print(f"      ⚠️  OCR unavailable: pip install pytesseract pillow")
-                    content = ""
-                except Exception as e:
-                    print(f"      ⚠️  OCR failed: {str(e)}")
-                    content = ""
+                        print(f"      🔍 Running OCR on image...")
+                        image = Image.open(file_path)
+                        content = pytesseract.image_to_string(image)[:2000]
+                    except ImportError:
+                        print(f"      ⚠️  OCR unavailable: pip install pytesseract pillow")
+                        content = ""
+                    except Exception as e:
+                        print(f"      ⚠️  OCR failed: {str(e)}")
+                        content = ""
             
             # PDF files - try multiple methods
             elif file_extension == '.pdf':
-                # Method 1: Try PyMuPDF (fitz) for text extraction
-                try:
-                    import fitz  # PyMuPDF
-                    print(f"      📄 Extracting text from PDF...")
-                    doc = fitz.open(file_path)
-                    text_content = ""
-                    for page_num in range(min(3, len(doc))):  # First 3 pages
-                        page = doc.load_page(page_num)
-                        text_content += page.get_text()
-                        if len(text_content) > 2000:
-                            break
-                    doc.close()
-                    content = text_content[:2000]
+                with _EXTRACTION_LOCK:
+                    # Method 1: Try PyMuPDF (fitz) for text extraction
+                    try:
+                        import fitz  # PyMuPDF
+                        print(f"      📄 Extracting text from PDF...")
+                        doc = fitz.open(file_path)
+                        text_content = ""
+                        for page_num in range(min(3, len(doc))):  # First 3 pages
+                            page = doc.load_page(page_num)
+                            text_content += page.get_text()
+                            if len(text_content) > 2000:
+                                break
+                        doc.close()
+                        content = text_content[:2000]
                     
-                    # If no text found, might be scanned PDF - try OCR
-                    if len(content.strip()) < 50:
-                        print(f"      🔍 PDF appears to be scanned, trying OCR...")
-                        try:
-                            import pytesseract
-                            from PIL import Image
+                        # If no text found, might be scanned PDF - try OCR
+                        if len(content.strip()) < 50:
+                            print(f"      🔍 PDF appears to be scanned, trying OCR...")
+                            try:
+                                import pytesseract
+                                from PIL import Image
                             
-                            # Configure Tesseract path if not in PATH
-                            self.configure_tesseract_path()
+                                # Configure Tesseract path if not in PATH
+                                self.configure_tesseract_path()
                             
-                            # Convert PDF pages to images and OCR
-                            doc = fitz.open(file_path)
-                            ocr_text = ""
-                            for page_num in range(min(2, len(doc))):  # First 2 pages for OCR
-                                page = doc.load_page(page_num)
-                                pix = page.get_pixmap()
-                                img_data = pix.tobytes("ppm")
-                                image = Image.open(io.BytesIO(img_data))
-                                page_text = pytesseract.image_to_string(image)
-                                ocr_text += page_text
-                                if len(ocr_text) > 1500:
-                                    break
-                            doc.close()
-                            content = ocr_text[:2000]
-                        except ImportError:
-                            print(f"      ⚠️  OCR unavailable for scanned PDF: pip install pytesseract pillow")
-                        except Exception as e:
-                            print(f"      ⚠️  PDF OCR failed: {str(e)}")
+                                # Convert PDF pages to images and OCR
+                                doc = fitz.open(file_path)
+                                ocr_text = ""
+                                for page_num in range(min(2, len(doc))):  # First 2 pages for OCR
+                                    page = doc.load_page(page_num)
+                                    pix = page.get_pixmap()
+                                    img_data = pix.tobytes("ppm")
+                                    image = Image.open(io.BytesIO(img_data))
+                                    page_text = pytesseract.image_to_string(image)
+                                    ocr_text += page_text
+                                    if len(ocr_text) > 1500:
+                                        break
+                                doc.close()
+                                content = ocr_text[:2000]
+                            except ImportError:
+                                print(f"      ⚠️  OCR unavailable for scanned PDF: pip install pytesseract pillow")
+                            except Exception as e:
+                                print(f"      ⚠️  PDF OCR failed: {str(e)}")
                             
-                except ImportError:
-                    print(f"      ⚠️  PDF reading unavailable: pip install PyMuPDF")
-                    content = ""
-                except Exception as e:
-                    print(f"      ⚠️  PDF extraction failed: {str(e)}")
-                    content = ""
+                    except ImportError:
+                        print(f"      ⚠️  PDF reading unavailable: pip install PyMuPDF")
+                        content = ""
+                    except Exception as e:
+                        print(f"      ⚠️  PDF extraction failed: {str(e)}")
+                        content = ""
             
             # Word documents
             elif file_extension in {'.doc', '.docx'}:
@@ -966,15 +1352,21 @@ Provide a concise description of what this document probably contains based on i
     def get_local_content_summary(self, file_path):
         """Generate a local content summary by reading the document"""
         try:
+            # Reuse the summary of an unchanged file from this or an earlier run
+            cache_key = self._cache_key('summary-local', file_path)
+            cached_summary = self._cache_get(cache_key)
+            if cached_summary is not _CACHE_MISS:
+                return cached_summary
+            
             filename = file_path.stem
             
             # Remove date prefix from filename for cleaner analysis
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}_', filename):
+            if _DATE_PREFIX_RE.match(filename):
                 clean_filename = filename[11:]
             else:
                 clean_filename = filename
             
-            clean_filename = clean_filename.replace('_', ' ').replace('-', ' ')
+            clean_filename = clean_filename.translate(_SEPARATORS_TO_SPACES)
             
             # Extract text content using our comprehensive extraction method
             content = self.extract_text_from_file(file_path)
@@ -988,13 +1380,9 @@ Provide a concise description of what this document probably contains based on i
                     line = line.strip()
                     # Skip headers, dates, and very short lines
                     if (len(line) > 15 and 
-                        not line.startswith('#') and 
-                        not line.startswith('*') and
-                        not line.startswith('-') and
-                        not re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', line) and
-                        not line.lower().startswith('date:') and
-                        not line.lower().startswith('from:') and
-                        not line.lower().startswith('to:')):
+                        not line.startswith(('#', '*', '-')) and
+                        not _DATE_LINE_RE.match(line) and
+                        not line[:5].lower().startswith(('date:', 'from:', 'to:'))):
                         meaningful_lines.append(line)
                         if len(meaningful_lines) >= 3:
                             break
@@ -1005,348 +1393,17 @@ Provide a concise description of what this document probably contains based on i
                     if len(summary_text) > 200:
                         summary_text = summary_text[:200] + "..."
                     
-                    return f"This document discusses: {summary_text}"
+                    summary = f"This document discusses: {summary_text}"
+                    self._cache_set(cache_key, summary)
+                    return summary
             
-            # Fallback for non-readable files or when content analysis fails
+            # Fallback for non-readable files or when content analysis fails; not
+            # cached, so a later run with PyMuPDF or OCR available can do better
             doc_type = self.get_document_type_description(file_path).lower()
             return f"This appears to be a {doc_type} titled '{clean_filename.title()}'. Unable to extract readable text content for detailed analysis."
             
         except Exception as e:
             return f"Unable to analyze document content: {str(e)}"
-        """Use ChatGPT API to identify document type"""
-        if not self.openai_api_key:
-            return self.get_document_type_description(file_path)
-        
-        try:
-            import requests
-        except ImportError:
-            print("Warning: requests library not available. Install with: pip install requests")
-            return self.get_document_type_description(file_path)
-        
-        try:
-            file_extension = file_path.suffix.lower()
-            filename = file_path.stem
-            
-            # Remove date prefix from filename for cleaner analysis
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}_', filename):
-                clean_filename = filename[11:]
-            else:
-                clean_filename = filename
-            
-            clean_filename = clean_filename.replace('_', ' ').replace('-', ' ')
-            
-            # Try to read content for text files
-            content = ""
-            is_text_file = file_extension in {'.txt', '.md', '.csv', '.json', '.xml', '.html', '.htm', '.log'}
-            
-            if is_text_file:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read(1000)  # Read first 1000 chars
-                except Exception:
-                    pass
-            
-            # Prepare prompt for ChatGPT - focused on document type identification
-            if content and len(content.strip()) > 50:
-                prompt = f"""Based on the filename and content, identify what type of document this is in 1-3 words maximum.
-
-Filename: {clean_filename}
-File type: {file_extension.upper()}
-
-Content preview:
-{content[:800]}
-
-Examples of good responses: "Invoice", "Meeting Notes", "Contract", "Transcript", "Email", "Report", "Research Paper", "Presentation", "Manual", "Policy Document"
-
-Response (1-3 words only):"""
-            else:
-                # For non-text files or files we can't read
-                prompt = f"""Based on the filename and file type, identify what type of document this likely is in 1-3 words maximum.
-
-Filename: {clean_filename}
-File type: {file_extension.upper()}
-
-Examples of good responses: "Invoice", "Contract", "Report", "Presentation", "Image File", "Spreadsheet", "PDF Document"
-
-Response (1-3 words only):"""
-            
-            # Make API call to OpenAI
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': 'gpt-3.5-turbo',
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'max_tokens': 20,  # Very short response
-                'temperature': 0.1  # Low temperature for consistent classification
-            }
-            
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                doc_type = result['choices'][0]['message']['content'].strip()
-                
-                # Clean up the response
-                doc_type = doc_type.replace('"', '').replace("'", '').strip()
-                
-                # Ensure it's title case and reasonable length
-                if len(doc_type) <= 50 and doc_type:
-                    return doc_type.title()
-                else:
-                    return self.get_document_type_description(file_path)
-            
-            else:
-                print(f"OpenAI API error: {response.status_code}")
-                return self.get_document_type_description(file_path)
-                
-        except Exception as e:
-            print(f"Error calling ChatGPT API: {e}")
-            return self.get_document_type_description(file_path)
-        """Generate summary using ChatGPT API"""
-        if not self.openai_api_key:
-            return self.get_fallback_summary(file_path, max_sentences)
-        
-        try:
-            import requests
-        except ImportError:
-            print("Warning: requests library not available. Install with: pip install requests")
-            return self.get_fallback_summary(file_path, max_sentences)
-        
-        try:
-            file_extension = file_path.suffix.lower()
-            file_size = file_path.stat().st_size
-            filename = file_path.stem
-            
-            # Remove date prefix from filename for cleaner title
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}_', filename):
-                clean_filename = filename[11:]
-            else:
-                clean_filename = filename
-            
-            clean_filename = clean_filename.replace('_', ' ').replace('-', ' ')
-            file_size_str = self.format_file_size(file_size)
-            
-            # Try to read content for text files
-            content = ""
-            is_text_file = file_extension in {'.txt', '.md', '.csv', '.json', '.xml', '.html', '.htm', '.log'}
-            
-            if is_text_file:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read(2000)  # Read first 2000 chars
-                except Exception:
-                    pass
-            
-            # Prepare prompt for ChatGPT
-            if content and len(content.strip()) > 50:
-                prompt = f"""Please provide exactly 3 sentences summarizing this document:
-
-Filename: {clean_filename}
-File type: {file_extension.upper()}
-File size: {file_size_str}
-
-Content preview:
-{content[:1500]}
-
-Please respond with exactly 3 sentences that describe what this document is about, its purpose, and key information. Do not include any other text or formatting."""
-            else:
-                # For non-text files or files we can't read
-                prompt = f"""Please provide exactly 3 sentences describing this document based on its filename and file type:
-
-Filename: {clean_filename}
-File type: {file_extension.upper()}
-File size: {file_size_str}
-
-This appears to be a document that may be scanned, binary, or in a format that requires special software to read. Please provide 3 sentences describing what this document likely contains based on the filename and file type, its probable purpose, and what kind of information it might hold."""
-            
-            # Make API call to OpenAI
-            headers = {
-                'Authorization': f'Bearer {self.openai_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'model': 'gpt-3.5-turbo',
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'max_tokens': 200,
-                'temperature': 0.3
-            }
-            
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                summary_text = result['choices'][0]['message']['content'].strip()
-                
-                # Split into sentences and clean up
-                sentences = []
-                for delimiter in ['. ', '! ', '? ']:
-                    parts = summary_text.split(delimiter)
-                    if len(parts) > 1:
-                        for i, part in enumerate(parts):
-                            if part.strip():
-                                sentences.append(part.strip() + (delimiter.strip() if i < len(parts)-1 and part != parts[-1] else ''))
-                        break
-                else:
-                    # If no delimiters found, treat as single sentence
-                    sentences = [summary_text]
-                
-                # Clean up and return up to max_sentences
-                clean_sentences = []
-                for sentence in sentences[:max_sentences]:
-                    sentence = sentence.strip()
-                    if sentence and len(sentence) > 5:
-                        # Ensure sentence ends with punctuation
-                        if not sentence[-1] in '.!?':
-                            sentence += '.'
-                        clean_sentences.append(sentence)
-                
-                if clean_sentences:
-                    return clean_sentences
-            
-            else:
-                print(f"OpenAI API error: {response.status_code} - {response.text}")
-                return self.get_fallback_summary(file_path, max_sentences)
-                
-        except Exception as e:
-            print(f"Error calling ChatGPT API: {e}")
-            return self.get_fallback_summary(file_path, max_sentences)
-    
-    def get_fallback_summary(self, file_path, max_sentences=3):
-        """Generate fallback summary when ChatGPT API is not available"""
-        try:
-            file_extension = file_path.suffix.lower()
-            file_size = file_path.stat().st_size
-            filename = file_path.stem
-            
-            # Try to read content for text-based files
-            content = ""
-            is_readable = False
-            
-            # Only attempt to read content for likely text files
-            text_extensions = {'.txt', '.md', '.csv', '.json', '.xml', '.html', '.htm', '.log'}
-            
-            if file_extension in text_extensions:
-                encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-                
-                for encoding in encodings:
-                    try:
-                        with open(file_path, 'r', encoding=encoding) as f:
-                            content = f.read(500)  # Read first 500 chars to check if it's readable
-                            # Check if content seems like text (not binary)
-                            if len(content) > 20 and not any(ord(c) < 32 and c not in '\n\r\t' for c in content[:100]):
-                                is_readable = True
-                                break
-                    except (UnicodeDecodeError, PermissionError):
-                        continue
-            
-            # Generate summary based on available information
-            if is_readable and content.strip():
-                # For readable text files, try to extract meaningful content
-                lines = content.split('\n')
-                cleaned_lines = []
-                
-                for line in lines:
-                    line = line.strip()
-                    if len(line) > 10 and not line.startswith('#') and not line.startswith('*'):
-                        if not any(keyword in line.lower() for keyword in ['date:', 'time:', 'location:']):
-                            cleaned_lines.append(line)
-                
-                if cleaned_lines:
-                    # Try to create content-based summary
-                    summary_text = ' '.join(cleaned_lines[:3])
-                    if len(summary_text) > 50:
-                        sentences = []
-                        for delimiter in ['. ', '! ', '? ']:
-                            parts = summary_text.split(delimiter)
-                            if len(parts) > 1:
-                                for i, part in enumerate(parts[:max_sentences]):
-                                    if part.strip():
-                                        sentences.append(part.strip() + (delimiter.strip() if i < len(parts)-1 else ''))
-                                break
-                        
-                        if sentences:
-                            return sentences[:max_sentences]
-            
-            # For non-readable files or when content extraction fails, create descriptive summary
-            file_size_str = self.format_file_size(file_size)
-            
-            # Extract meaningful information from filename
-            filename_clean = filename.replace('_', ' ').replace('-', ' ')
-            # Remove date prefix if present
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}\s+', filename_clean):
-                filename_clean = filename_clean[11:].strip()
-            
-            # Generate summary based on file type and name
-            if file_extension == '.pdf':
-                summary_sentences = [
-                    f"This is a PDF document titled '{filename_clean}' with a file size of {file_size_str}.",
-                    f"The document appears to be a scanned or non-text-searchable PDF file.",
-                    f"Content analysis requires OCR processing to extract readable text."
-                ]
-            elif file_extension in {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'}:
-                summary_sentences = [
-                    f"This is an image file titled '{filename_clean}' in {file_extension.upper()} format.",
-                    f"The image has a file size of {file_size_str} and may contain document content.",
-                    f"Text extraction would require OCR processing to analyze any textual content."
-                ]
-            elif file_extension in {'.doc', '.docx'}:
-                summary_sentences = [
-                    f"This is a Microsoft Word document titled '{filename_clean}' with a file size of {file_size_str}.",
-                    f"The document may contain formatted text, images, and other elements.",
-                    f"Advanced document parsing would be required to extract detailed content information."
-                ]
-            elif file_extension in {'.xls', '.xlsx'}:
-                summary_sentences = [
-                    f"This is a Microsoft Excel spreadsheet titled '{filename_clean}' with a file size of {file_size_str}.",
-                    f"The spreadsheet likely contains tabular data, formulas, and calculations.",
-                    f"Detailed analysis would require specialized Excel parsing to examine cell contents."
-                ]
-            elif file_extension in {'.ppt', '.pptx'}:
-                summary_sentences = [
-                    f"This is a Microsoft PowerPoint presentation titled '{filename_clean}' with a file size of {file_size_str}.",
-                    f"The presentation likely contains slides with text, images, and multimedia elements.",
-                    f"Content extraction would require specialized presentation parsing tools."
-                ]
-            else:
-                # Generic file summary
-                summary_sentences = [
-                    f"This is a {file_extension.upper().replace('.', '')} file titled '{filename_clean}' with a file size of {file_size_str}.",
-                    f"The file format may require specialized software or tools for content analysis.",
-                    f"Manual review of the document would be needed to determine specific content details."
-                ]
-            
-            return summary_sentences[:max_sentences]
-            
-        except Exception as e:
-            return [
-                f"Error analyzing document: {str(e)}",
-                "The file may be corrupted, inaccessible, or in an unsupported format.",
-                "Manual review of the document is recommended."
-            ]
 
     def format_file_size(self, size_bytes):
         """Format file size in human-readable format"""
@@ -1366,16 +1423,16 @@ This appears to be a document that may be scanned, binary, or in a format that r
             filename = file_path.stem
             
             # Remove date prefix from filename for cleaner analysis
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}_', filename):
+            if _DATE_PREFIX_RE.match(filename):
                 clean_filename = filename[11:]
             else:
                 clean_filename = filename
             
-            clean_filename = clean_filename.lower().replace('_', ' ').replace('-', ' ')
+            clean_filename = clean_filename.lower().translate(_SEPARATORS_TO_SPACES)
             
             # Try to read content for text files to get better classification
             content = ""
-            is_text_file = file_extension in {'.txt', '.md', '.csv', '.json', '.xml', '.html', '.htm', '.log'}
+            is_text_file = file_extension in _TEXT_EXTENSIONS
             
             if is_text_file:
                 try:
@@ -1478,8 +1535,15 @@ This appears to be a document that may be scanned, binary, or in a format that r
         else:
             return [self.get_local_content_summary(file_path)]
 
-    def create_pdf_summary(self, output_dir=None, summarize_only=False):
-        """Create a comprehensive PDF summary of all documents"""
+    def create_pdf_summary(self, output_dir=None, summarize_only=False, output_path=None):
+        """
+        Create a comprehensive PDF summary of all documents
+        
+        Args:
+            output_dir (str): Folder for the dated PDF file (defaults to the document folder)
+            summarize_only (bool): If True, analyze every file without renaming
+            output_path (str): Exact PDF path to write instead of a dated file in output_dir
+        """
         try:
             from reportlab.lib.pagesizes import letter, A4
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
@@ -1502,20 +1566,20 @@ This appears to be a document that may be scanned, binary, or in a format that r
         else:
             pdf_filename = f"{timestamp}_Document_Processing_Summary.pdf"
         
-        pdf_path = output_dir / pdf_filename
-        
-        # Ensure unique filename
-        counter = 1
-        while pdf_path.exists():
-            if summarize_only:
-                pdf_filename = f"{timestamp}_Document_Analysis_Summary_{counter}.pdf"
-            else:
-                pdf_filename = f"{timestamp}_Document_Processing_Summary_{counter}.pdf"
+        if output_path is not None:
+            pdf_path = Path(output_path)
+        else:
             pdf_path = output_dir / pdf_filename
-            counter += 1
-        
-        # Create PDF document
-        doc = SimpleDocTemplate(str(pdf_path), pagesize=A4, topMargin=1*inch, bottomMargin=1*inch)
+            
+            # Ensure unique filename
+            counter = 1
+            while pdf_path.exists():
+                if summarize_only:
+                    pdf_filename = f"{timestamp}_Document_Analysis_Summary_{counter}.pdf"
+                else:
+                    pdf_filename = f"{timestamp}_Document_Processing_Summary_{counter}.pdf"
+                pdf_path = output_dir / pdf_filename
+                counter += 1
         
         # Styles
         styles = getSampleStyleSheet()
@@ -1575,17 +1639,21 @@ This appears to be a document that may be scanned, binary, or in a format that r
         # Get files to process
         if summarize_only:
             # For summary-only mode, process all files (not just unprocessed ones)
-            all_files = []
-            for file_path in self.folder_path.iterdir():
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    all_files.append(file_path)
-            files_to_process = sorted(all_files, key=lambda x: x.name.lower())
+            with os.scandir(self.folder_path) as entries:
+                selected = [entry for entry in entries
+                            if entry.is_file() and not entry.name.startswith('.')]
+            selected.sort(key=lambda entry: entry.name.lower())
         else:
-            # For processing mode, use the usual logic
-            files_to_process = [
-                file_path for file_path in self.folder_path.iterdir()
-                if self.is_valid_file(file_path)
-            ]
+            # For processing mode, use the usual is_valid_file checks
+            with os.scandir(self.folder_path) as entries:
+                selected = [entry for entry in entries
+                            if not entry.name.startswith('.')
+                            and not entry.is_dir()
+                            and not _DATE_PREFIX_RE.match(entry.name)]
+        
+        # Sizes come from each entry's cached stat, taken once per file
+        files_to_process = [Path(entry.path) for entry in selected]
+        file_sizes = {file_path: entry.stat().st_size for file_path, entry in zip(files_to_process, selected)}
         
         content.append(Paragraph(f"<b>Files Analyzed:</b> {len(files_to_process)}", styles['Normal']))
         content.append(Spacer(1, 30))
@@ -1597,18 +1665,37 @@ This appears to be a document that may be scanned, binary, or in a format that r
             
             print(f"📊 Analyzing {len(files_to_process)} documents...")
             
+            if self.openai_api_key:
+                print(f"   🤖 Generating content summaries with ChatGPT...")
+            else:
+                print(f"   📝 Analyzing document content...")
+            
+            # Generate the summaries concurrently so file reads and API calls overlap,
+            # reporting each file as it finishes; the document sections are still
+            # built in order below
+            summaries = {}
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(self._try_document_summary, file_path): file_path
+                           for file_path in files_to_process}
+                for done, future in enumerate(as_completed(futures), 1):
+                    file_path = futures[future]
+                    summaries[file_path] = future.result()
+                    print(f"   📄 Processed {done}/{len(files_to_process)}: {file_path.name}")
+                    if summaries[file_path][1] is not None:
+                        print(f"      ⚠️  Error generating summary: {summaries[file_path][1]}")
+            
             for i, file_path in enumerate(files_to_process, 1):
-                print(f"   📄 Processing {i}/{len(files_to_process)}: {file_path.name}")
+                summary_sentences, error = summaries[file_path]
                 
                 # Extract clean title from filename
                 filename = file_path.stem
-                if re.match(r'^\d{4}\.\d{2}\.\d{2}_', filename):
-                    clean_title = filename[11:].replace('_', ' ').replace('-', ' ').title()
+                if _DATE_PREFIX_RE.match(filename):
+                    clean_title = filename[11:].translate(_SEPARATORS_TO_SPACES).title()
                 else:
-                    clean_title = filename.replace('_', ' ').replace('-', ' ').title()
+                    clean_title = filename.translate(_SEPARATORS_TO_SPACES).title()
                 
                 # File details
-                file_size = file_path.stat().st_size
+                file_size = file_sizes[file_path]
                 file_size_str = self.format_file_size(file_size)
                 file_ext = file_path.suffix.upper()
                 
@@ -1616,22 +1703,14 @@ This appears to be a document that may be scanned, binary, or in a format that r
                 title_with_filename = f"{clean_title} - {file_path.name}"
                 content.append(Paragraph(f"{i}. {title_with_filename}", subheading_style))
                 
-                # Get document content summary
-                try:
-                    if self.openai_api_key:
-                        print(f"      🤖 Generating content summary with ChatGPT...")
-                        summary = self.get_chatgpt_content_summary(file_path)
-                    else:
-                        print(f"      � Analyzing document content...")
-                        summary = self.get_local_content_summary(file_path)
-                    
+                # Add document content summary
+                if error is None:
                     # Clean summary for PDF
+                    summary = summary_sentences[0]
                     clean_summary = summary.replace('<', '&lt;').replace('>', '&gt;').replace('&', '&amp;')
                     content.append(Paragraph(clean_summary, body_style))
-                
-                except Exception as e:
-                    print(f"      ⚠️  Error generating summary: {str(e)}")
-                    content.append(Paragraph(f"<b>Summary:</b> Error analyzing document content: {str(e)}", body_style))
+                else:
+                    content.append(Paragraph(f"<b>Summary:</b> Error analyzing document content: {error}", body_style))
                 
                 content.append(Spacer(1, 20))
                 
@@ -1657,7 +1736,7 @@ This appears to be a document that may be scanned, binary, or in a format that r
             if ext not in file_types:
                 file_types[ext] = 0
             file_types[ext] += 1
-            total_size += file_path.stat().st_size
+            total_size += file_sizes[file_path]
         
         content.append(Paragraph(f"<b>Total Documents:</b> {len(files_to_process)}", styles['Normal']))
         content.append(Paragraph(f"<b>Total Size:</b> {self.format_file_size(total_size)}", styles['Normal']))
@@ -1671,37 +1750,73 @@ This appears to be a document that may be scanned, binary, or in a format that r
         
         # Build PDF
         print(f"📝 Finalizing PDF document...")
-        doc.build(content)
+        # Build into a hidden file next to the target and move it into place only once
+        # layout succeeds, so a failed build never truncates an existing PDF. It is
+        # created only now so it is not picked up as a document above.
+        temp_path = pdf_path.with_name(f".{pdf_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'wb', buffering=1 << 20) as pdf_file:
+                doc = SimpleDocTemplate(pdf_file, pagesize=A4, topMargin=1*inch, bottomMargin=1*inch)
+                doc.build(content)
+            os.replace(temp_path, pdf_path)
+        except BaseException:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            raise
         print(f"✅ PDF generation complete!")
         
         return pdf_path
 
-    def print_summary(self):
-        """Print a final summary of the operation"""
-        print("=" * 80)
-        print("OPERATION SUMMARY")
-        print("=" * 80)
-        print(f"Successfully processed: {len(self.processed_files)} files")
-        print(f"Errors encountered: {len(self.errors)} files")
-        print(f"Date extraction: {'Enabled' if self.use_file_dates else 'Disabled'}")
+    def print_summary(self, create_summary=True):
+        """
+        Print a final summary of the operation
+        
+        Args:
+            create_summary (bool): If True, create a summary document unless process_folder already did
+        """
+        # Build the report first and write it in one call
+        buf = io.StringIO()
+        buf.write("=" * 80 + "\n")
+        buf.write("OPERATION SUMMARY\n")
+        buf.write("=" * 80 + "\n")
+        buf.write(f"Successfully processed: {len(self.processed_files)} files\n")
+        buf.write(f"Errors encountered: {len(self.errors)} files\n")
+        buf.write(f"Date extraction: {'Enabled' if self.use_file_dates else 'Disabled'}\n")
         
         if self.processed_files:
-            print("\nProcessed files with extracted dates:")
+            buf.write("\nProcessed files with extracted dates:\n")
             for old_name, new_name, extracted_date in self.processed_files:
-                print(f"  {old_name} -> {new_name} [Date: {extracted_date.strftime('%Y-%m-%d')}]")
+                buf.write(f"  {old_name} -> {new_name} [Date: {extracted_date.date().isoformat()}]\n")
         
         if self.errors:
-            print("\nFiles with errors:")
+            buf.write("\nFiles with errors:\n")
             for filename, error in self.errors:
-                print(f"  - {filename}: {error}")
+                buf.write(f"  - {filename}: {error}\n")
+        
+        sys.stdout.write(buf.getvalue())
         
-        # Create summary document
-        summary_path = self.create_summary_document()
-        if summary_path:
-            print(f"\nDetailed summary document created: {summary_path.name}")
+        # Create summary document, unless this run already wrote one
+        if create_summary and self._summary_path is None:
+            summary_path = self.create_summary_document()
+            if summary_path:
+                print(f"\nDetailed summary document created: {summary_path.name}")
 
 
-def main():
+def _positive_int(value):
+    """argparse type for options that need a whole number of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser():
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(
         description="Rename documents with date prefix extracted from filenames, remove dates from filenames, or create comprehensive PDF summaries"
     )
@@ -1737,26 +1852,73 @@ def main():
         "--openai-api-key",
         help="OpenAI API key for ChatGPT-powered document summaries"
     )
+    parser.add_argument(
+        "--model",
+        help="OpenAI chat model used for summaries, e.g. gpt-4o-mini. Default: gpt-3.5-turbo"
+    )
     parser.add_argument(
         "--summarize-only",
         action="store_true",
         help="Create comprehensive PDF summary of all documents without renaming files (includes AI-powered summaries when --openai-api-key provided)"
     )
+    parser.add_argument(
+        "--output",
+        metavar="PATH",
+        help="Write the --summarize-only PDF to this path instead of a dated file in the folder"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse summaries of unchanged files across runs (stored as JSON in the user cache directory)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        metavar="N",
+        help="Number of worker threads used to analyze files. Default: based on CPU count"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Don't print per-file filename analysis messages"
+    )
+    
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_parser():
+    """Build the parser once for repeated in-process main() calls"""
+    return build_parser()
+
+
+def main(argv=None):
+    """
+    Run the command line interface
     
-    args = parser.parse_args()
+    Args:
+        argv (list): Arguments to parse instead of sys.argv[1:]
+    """
+    parser = _cached_parser()
+    args = parser.parse_args(argv)
+    if args.output and not args.summarize_only:
+        parser.error("--output can only be used with --summarize-only")
+    renamer = None
     
     try:
         use_file_dates = not args.no_extract
         create_summary = not args.no_summary
         
-        renamer = DocumentRenamer(args.folder, args.date, use_file_dates, args.openai_api_key)
+        renamer = DocumentRenamer(args.folder, args.date, use_file_dates, args.openai_api_key, args.workers,
+                                  use_cache=args.cache, verbose=not args.quiet,
+                                  openai_model=args.model)
         
         if args.summarize_only:
             # Summary-only mode: create PDF summary without renaming
             print(f"Creating comprehensive PDF summary for folder: {args.folder}")
             print("=" * 70)
             
-            pdf_path = renamer.create_pdf_summary(summarize_only=True)
+            pdf_path = renamer.create_pdf_summary(summarize_only=True, output_path=args.output)
             print(f"\n✅ PDF summary created: {pdf_path.name}")
             print(f"Location: {pdf_path.resolve()}")
             
@@ -1768,11 +1930,14 @@ def main():
             renamer.process_folder(dry_run=args.dry_run, create_summary=create_summary)
             
             if not args.dry_run:
-                renamer.print_summary()
+                renamer.print_summary(create_summary=create_summary)
             
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if renamer is not None:
+            renamer.close_cache()
 
 
 if __name__ == "__main__":
@@ -14,7 +14,7 @@ def example_usage():
     print("-" * 40)
     
     folder_path = "/workspaces/document-rename-and-/test_documents"
-    renamer = DocumentRenamer(folder_path)
+    renamer = DocumentRenamer(folder_path, use_cache=False)
     
     # Check if there are files to process
     files = [f for f in Path(folder_path).iterdir() if renamer.is_valid_file(f)]
@@ -37,7 +37,7 @@ def example_usage():
     print("-" * 40)
     
     try:
-        custom_renamer = DocumentRenamer(folder_path, date_override="2024-12-25")
+        custom_renamer = DocumentRenamer(folder_path, date_override="2024-12-25", use_cache=False)
         print(f"Using custom date prefix: {custom_renamer.date_prefix}")
         
         # Run in dry-run mode to show what would happen
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the opt-in analysis cache
+"""
+
+import sys
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add current directory to path to import document_renamer
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from document_renamer import DocumentRenamer
+
+TEXT = ("Invoice Date: 2024-03-01\n"
+        "This invoice covers the quarterly maintenance of the office printers.\n")
+
+
+@contextmanager
+def cached_folder():
+    """Yield (document folder, user cache directory), both temporary"""
+    with tempfile.TemporaryDirectory() as folder, tempfile.TemporaryDirectory() as cache_home:
+        saved = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = cache_home
+        try:
+            (Path(folder) / "invoice.txt").write_text(TEXT, encoding="utf-8")
+            yield Path(folder), Path(cache_home)
+        finally:
+            if saved is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = saved
+
+
+def analyze(folder, use_cache=True):
+    """Run date and summary analysis on invoice.txt once, saving the cache"""
+    renamer = DocumentRenamer(str(folder), date_override="2000-01-01", use_cache=use_cache)
+    file_path = folder / "invoice.txt"
+    results = (renamer.extract_dates_from_content(file_path), renamer.get_local_content_summary(file_path))
+    renamer.close_cache()
+    return renamer, results
+
+
+def fail_if_called(*args, **kwargs):
+    raise AssertionError("the file was analyzed again instead of using the cache")
+
+
+def test_second_run_hits_cache():
+    """An unchanged file is answered from the cache saved by the previous run"""
+    with cached_folder() as (folder, cache_home):
+        _, first = analyze(folder)
+        assert len(list(cache_home.rglob("*.json"))) == 1
+
+        renamer = DocumentRenamer(str(folder), date_override="2000-01-01", use_cache=True)
+        renamer._find_content_date = fail_if_called
+        renamer.extract_text_from_file = fail_if_called
+        file_path = folder / "invoice.txt"
+        second = (renamer.extract_dates_from_content(file_path), renamer.get_local_content_summary(file_path))
+        assert second == first
+
+
+def test_changed_file_misses_cache():
+    """A new modification time invalidates the cached results"""
+    with cached_folder() as (folder, cache_home):
+        analyze(folder)
+
+        file_path = folder / "invoice.txt"
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        calls = []
+        renamer = DocumentRenamer(str(folder), date_override="2000-01-01", use_cache=True)
+        find_content_date = renamer._find_content_date
+        renamer._find_content_date = lambda text: calls.append(text) or find_content_date(text)
+        assert renamer.extract_dates_from_content(file_path).date().isoformat() == "2024-03-01"
+        assert len(calls) == 1
+
+
+def test_no_cache_writes_nothing():
+    """Without use_cache nothing is written to the cache directory or the folder"""
+    with cached_folder() as (folder, cache_home):
+        analyze(folder, use_cache=False)
+        assert list(cache_home.iterdir()) == []
+        assert [path.name for path in folder.iterdir()] == ["invoice.txt"]
+
+
+if __name__ == "__main__":
+    test_second_run_hits_cache()
+    test_changed_file_misses_cache()
+    test_no_cache_writes_nothing()
+    print("✅ Cache tests passed!")
@@ -29,7 +29,7 @@ def test_summary_generation():
     print("1. Testing Fallback Mode (no ChatGPT API):")
     print("-" * 50)
     
-    renamer_fallback = DocumentRenamer(str(test_dir), use_file_dates=True, openai_api_key=None)
+    renamer_fallback = DocumentRenamer(str(test_dir), use_file_dates=True, openai_api_key=None, use_cache=False)
     fallback_summary = renamer_fallback.get_document_summary(test_file)
     
     print(f"File: {test_file.name}")
@@ -45,7 +45,7 @@ def test_summary_generation():
         print("2. Testing ChatGPT API Mode:")
         print("-" * 50)
         
-        renamer_api = DocumentRenamer(str(test_dir), use_file_dates=True, openai_api_key=api_key)
+        renamer_api = DocumentRenamer(str(test_dir), use_file_dates=True, openai_api_key=api_key, use_cache=False)
         api_summary = renamer_api.get_document_summary(test_file)
         
         print(f"File: {test_file.name}")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Regression tests for content date extraction priorities
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add current directory to path to import document_renamer
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from document_renamer import DocumentRenamer
+
+DEFAULT_DATE = datetime(2000, 1, 1)
+
+# (document text, expected date) pairs; each expectation matches the original
+# one-pattern-at-a-time scan
+CASES = [
+    # A low-priority "Next Meeting:" date must not swallow the standalone date after it
+    ("Next Meeting: October 1, 2024\nMeeting notes September 15, 2024", datetime(2024, 10, 1)),
+    # A word that is not a month must not consume the year of a real ISO date
+    ("Mayor 15 2024-01-15 quarterly figures", datetime(2024, 1, 15)),
+    # Equal scores go to the most recent date
+    ("Due Date: March 3, 2024 - see the January 5, 2023 letter", datetime(2024, 3, 3)),
+    ("Due Date: March 3, 2024\nSummary of the January 5, 2023 board meeting", datetime(2024, 3, 3)),
+    # A labelled date near the start beats a generic one further down
+    ("Invoice Date: 2024-03-01\n" + "x" * 300 + "\nDate: 2025-01-01", datetime(2024, 3, 1)),
+    ("Report\n" + "filler " * 40 + "\nLast Updated: June 2, 2023\nDeadline: 2024-12-31", datetime(2023, 6, 2)),
+    # Nothing that parses as a date falls back to the default
+    ("Mayor 15 2024 and 13/45/2024", DEFAULT_DATE),
+    # The whole document is scanned, not just its first 64 KiB
+    ("Updated March 3, 2020\n" + "lorem ipsum\n" * 7000 + "Invoice Date: 2024-02-29\n", datetime(2024, 2, 29)),
+    # The early-date boost window counts characters, not UTF-8 bytes...
+    ("é" * 150 + " Date: 2024-05-01\n" + "x" * 300 + "\nInvoice Date: 2023-01-01", datetime(2024, 5, 1)),
+    # ...and counts each CRLF line ending as one character
+    ("Notes\r\n" * 30 + "Date: 2024-05-01\r\n" + "x" * 300 + "\r\nInvoice Date: 2023-01-01", datetime(2024, 5, 1)),
+    # Non-ASCII whitespace such as NBSP still separates date parts
+    ("Date:\xa0March\xa03,\xa02024 and 2025-01-01", datetime(2024, 3, 3)),
+]
+
+
+def extract(text, folder):
+    """Write text to a file in folder and extract its content date"""
+    renamer = DocumentRenamer(folder, date_override=DEFAULT_DATE.strftime("%Y-%m-%d"))
+    file_path = Path(folder) / "document.txt"
+    file_path.write_bytes(text.encode("utf-8"))
+    return renamer.extract_dates_from_content(file_path)
+
+
+def test_content_date_priorities():
+    """Each case picks the same date as scanning the patterns one by one"""
+    with tempfile.TemporaryDirectory() as folder:
+        for text, expected in CASES:
+            found = extract(text, folder)
+            assert found == expected, f"{text[:80]!r}: expected {expected.date()}, got {found.date()}"
+
+
+if __name__ == "__main__":
+    test_content_date_priorities()
+    print("✅ Content date tests passed!")
@@ -23,7 +23,7 @@ def test_content_summaries():
     print("📖 Content Summary Test")
     print("=" * 60)
     
-    renamer = DocumentRenamer(str(demo_dir))
+    renamer = DocumentRenamer(str(demo_dir), use_cache=False)
     
     # Test on the original text files (not the generated PDFs/summaries)
     test_files = [
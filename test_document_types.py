@@ -23,7 +23,7 @@ def test_document_types():
     print("📋 Document Type Identification Test")
     print("=" * 50)
     
-    renamer = DocumentRenamer(str(demo_dir))
+    renamer = DocumentRenamer(str(demo_dir), use_cache=False)
     
     text_files = [f for f in demo_dir.glob("*.txt") if not f.name.startswith("2025")]
     md_files = [f for f in demo_dir.glob("*.md") if not f.name.startswith("2025")]
@@ -68,7 +68,7 @@ def test_ocr_functionality():
     print("\n🤖 Testing OCR text extraction...")
     
     test_dir = Path("test_ocr")
-    renamer = DocumentRenamer(str(test_dir))
+    renamer = DocumentRenamer(str(test_dir), use_cache=False)
     
     # Test image OCR
     extracted_text = renamer.extract_text_from_file(img_path)
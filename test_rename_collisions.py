@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for rename collision handling on case-sensitive and case-insensitive folders
+"""
+
+import sys
+import os
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add current directory to path to import document_renamer
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from document_renamer import DocumentRenamer
+
+
+def case_insensitive(folder):
+    """Check whether folder treats names differing only in case as the same file"""
+    probe = Path(folder) / "Probe.txt"
+    probe.write_text("probe")
+    try:
+        return (Path(folder) / "PROBE.TXT").exists()
+    finally:
+        probe.unlink()
+
+
+def test_rename_keeps_case_variants_apart():
+    """Renamed names that differ only in case get a suffix only when the filesystem folds case"""
+    with tempfile.TemporaryDirectory() as folder:
+        folds_case = case_insensitive(folder)
+        (Path(folder) / "Report.txt").write_text("first")
+        if not folds_case:
+            (Path(folder) / "report.txt").write_text("second")
+        (Path(folder) / "2024.03.01_REPORT.txt").write_text("already renamed")
+        renamer = DocumentRenamer(folder, date_override="2024-03-01", use_file_dates=False)
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            renamer.process_folder(create_summary=False)
+        names = sorted(os.listdir(folder))
+        if folds_case:
+            assert names == ["2024.03.01_REPORT.txt", "2024.03.01_Report_1.txt"], names
+        else:
+            assert names == ["2024.03.01_REPORT.txt", "2024.03.01_Report.txt", "2024.03.01_report.txt"], names
+
+
+def test_date_removal_keeps_case_variants_apart():
+    """Removing an end date only adds a suffix when the shorter name is taken"""
+    with tempfile.TemporaryDirectory() as folder:
+        folds_case = case_insensitive(folder)
+        (Path(folder) / "Notes.txt").write_text("kept")
+        (Path(folder) / "notes_2024-01-05.txt").write_text("dated")
+        renamer = DocumentRenamer(folder)
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            renamer.remove_dates_from_folder()
+        expected = ["Notes.txt", "notes_1.txt"] if folds_case else ["Notes.txt", "notes.txt"]
+        assert sorted(os.listdir(folder)) == expected
+
+
+if __name__ == "__main__":
+    test_rename_keeps_case_variants_apart()
+    test_date_removal_keeps_case_variants_apart()
+    print("✅ Rename collision tests passed!")
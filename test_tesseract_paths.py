@@ -18,7 +18,7 @@ def test_tesseract_detection():
     print("🔍 Tesseract Path Detection Test")
     print("=" * 50)
     
-    renamer = DocumentRenamer(".")
+    renamer = DocumentRenamer(".", use_cache=False)
     
     # Test the path configuration
     print("🔧 Testing Tesseract configuration...")